@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -18,13 +18,15 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from quiz_items import QuestionItem
+
 
 class QuestionCard(QFrame):
-    def __init__(self, number: int, item: Dict):
+    def __init__(self, number: int, item: QuestionItem):
         super().__init__()
 
         self.item = item
-        self.question_type = item.get("question_type", "essay")
+        self.question_type = item.question_type
         self._button_group: Optional[QButtonGroup] = None
         self._answer_label = QLabel()
         self._answer_label.setVisible(False)
@@ -51,7 +53,7 @@ class QuestionCard(QFrame):
         header_row.addWidget(self._score_label, alignment=Qt.AlignRight)
         container.addLayout(header_row)
 
-        question_label = QLabel(f"{number}. {item.get('question', '')}")
+        question_label = QLabel(f"{number}. {item.question}")
         question_label.setWordWrap(True)
         question_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         question_label.setStyleSheet("font-size: 14px; font-weight: 500;")
@@ -60,7 +62,7 @@ class QuestionCard(QFrame):
         self._answer_widgets: List[QWidget] = []
         self._build_answer_input(container)
 
-        answer_text = (item.get("answer") or "").strip()
+        answer_text = item.answer.strip()
         if answer_text and self.question_type != "essay":
             self._answer_label.setText(f"Answer: {answer_text}")
             self._answer_label.setStyleSheet("font-size: 13px;")
@@ -70,7 +72,7 @@ class QuestionCard(QFrame):
 
     def _build_answer_input(self, container: QVBoxLayout):
         question_type = self.question_type
-        choices = self.item.get("choices", [])
+        choices = self.item.choices
 
         if question_type == "multiple_choice":
             self._button_group = QButtonGroup(self)
@@ -156,7 +158,7 @@ class QuestionCard(QFrame):
         if self._button_group is None:
             return
 
-        correct_answer = str(self.item.get("answer", "")).strip()
+        correct_answer = self.item.answer.strip()
         if not correct_answer:
             return
 
@@ -210,7 +212,7 @@ class QuestionCard(QFrame):
         if self.question_type not in {"multiple_choice", "true_or_false"}:
             return False, 0, 0
 
-        correct_answer = str(self.item.get("answer", "")).strip()
+        correct_answer = self.item.answer.strip()
         selected_value = self._get_selected_value()
         earned = 0
 
@@ -242,7 +244,7 @@ class QuizCanvas(QWidget):
     quiz_started = Signal()
     quiz_revealed = Signal()
 
-    def __init__(self, generated_output: str, questions: List[Dict]):
+    def __init__(self, generated_output: str, questions: List[QuestionItem]):
         super().__init__()
 
         self.generated_output = generated_output
@@ -281,18 +283,10 @@ class QuizCanvas(QWidget):
 
         self.refresh(generated_output, questions)
 
-    def refresh(self, generated_output: str, questions: List[Dict]):
+    def refresh(self, generated_output: str, questions: List[QuestionItem]):
         self.generated_output = generated_output or ""
         self.questions = questions or []
-
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        self._cards = []
-        self.score_label.setText("Score: -")
+        self._clear_content()
 
         if not self.questions:
             fallback_editor = QTextEdit()
@@ -308,6 +302,52 @@ class QuizCanvas(QWidget):
             self.content_layout.addWidget(card)
             self._cards.append(card)
 
+        self._add_action_row()
+        self.set_locked_mode()
+
+    def begin_streaming(self):
+        self.generated_output = ""
+        self.questions = []
+        self._clear_content()
+
+    def append_question(self, item: QuestionItem):
+        self.questions.append(item)
+        card = QuestionCard(len(self._cards) + 1, item)
+        card.set_locked_mode()
+        self.content_layout.addWidget(card)
+        self._cards.append(card)
+
+    def finish_streaming(self, generated_output: str):
+        if not self._cards:
+            self.refresh(generated_output, [])
+            return
+
+        self.generated_output = generated_output or ""
+        self._add_action_row()
+        self.set_locked_mode()
+
+    def _clear_content(self):
+        while self.content_layout.count():
+            item = self.content_layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
+                continue
+            layout = item.layout()
+            if layout is not None:
+                self._clear_layout(layout)
+
+        self._cards = []
+        self.score_label.setText("Score: -")
+
+    def _clear_layout(self, layout):
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
+
+    def _add_action_row(self):
         self.finish_button = QPushButton("Finish")
         self.finish_button.setStyleSheet(
             "QPushButton { padding: 8px; font-size: 14px; background-color: #d32f2f; color: white; }"
@@ -327,7 +367,6 @@ class QuizCanvas(QWidget):
         self.content_layout.addLayout(action_row)
 
         self.content_layout.addStretch()
-        self.set_locked_mode()
 
     def set_locked_mode(self):
         for card in self._cards:
@@ -397,6 +436,7 @@ class OutputArea(QWidget):
         self._set_payloads = []
         self._set_views: List[QuizCanvas] = []
         self._loading_sets = False
+        self._streaming_view: Optional[QuizCanvas] = None
 
         layout = QVBoxLayout()
         layout.addWidget(self.tab_widget)
@@ -404,7 +444,7 @@ class OutputArea(QWidget):
 
         self.add_set("Set 1", "")
 
-    def _create_set_view(self, generated_output: str, questions: List[Dict]):
+    def _create_set_view(self, generated_output: str, questions: List[QuestionItem]):
         view = QuizCanvas(generated_output, questions)
         view.delete_requested.connect(lambda: self._on_view_delete_requested(view))
         view.quiz_started.connect(self.quiz_started.emit)
@@ -418,7 +458,7 @@ class OutputArea(QWidget):
         resolved_payload.setdefault("set_name", set_name)
         resolved_payload.setdefault("generated_output", generated_output)
         resolved_payload.setdefault("settings", {})
-        resolved_payload.setdefault("questions", self._parse_generated_output(generated_output))
+        resolved_payload.setdefault("questions", [])
 
         view = self._create_set_view(resolved_payload.get("generated_output", ""), resolved_payload.get("questions", []))
         self.tab_widget.addTab(view, set_name)
@@ -453,27 +493,66 @@ class OutputArea(QWidget):
                 self.tab_widget.setCurrentIndex(index)
                 return
 
-    def set_output_text(self, text: str):
+    def set_output_text(self, text: str, questions: Optional[List[QuestionItem]] = None):
         if self.tab_widget.count() == 0:
-            self.add_set("Set 1", text)
+            self.add_set("Set 1", text, {"questions": list(questions or [])})
             return
 
         index = self.tab_widget.currentIndex()
         if 0 <= index < len(self._set_payloads):
             self._set_payloads[index]["generated_output"] = text
-            self._set_payloads[index]["questions"] = self._parse_generated_output(text)
+            self._set_payloads[index]["questions"] = list(questions or [])
 
         if 0 <= index < len(self._set_views):
             view = self._set_views[index]
             payload = self._set_payloads[index]
             view.refresh(payload.get("generated_output", ""), payload.get("questions", []))
 
+    def begin_streaming(self):
+        if self.tab_widget.count() == 0:
+            self.add_set("Set 1", "")
+
+        index = self.tab_widget.currentIndex()
+        self._streaming_view = None
+        if 0 <= index < len(self._set_payloads):
+            self._set_payloads[index]["generated_output"] = ""
+            self._set_payloads[index]["questions"] = []
+        if 0 <= index < len(self._set_views):
+            self._streaming_view = self._set_views[index]
+            self._streaming_view.begin_streaming()
+
+    def _get_streaming_index(self) -> int:
+        if self._streaming_view is None:
+            return -1
+        return self.tab_widget.indexOf(self._streaming_view)
+
+    def append_streamed_question(self, item: QuestionItem):
+        index = self._get_streaming_index()
+        if 0 <= index < len(self._set_payloads):
+            self._set_payloads[index]["questions"].append(item)
+        if 0 <= index < len(self._set_views):
+            self._set_views[index].append_question(item)
+
+    def finish_streaming(self, text: str):
+        index = self._get_streaming_index()
+        self._streaming_view = None
+        if 0 <= index < len(self._set_payloads):
+            self._set_payloads[index]["generated_output"] = text
+        if 0 <= index < len(self._set_views):
+            self._set_views[index].finish_streaming(text)
+
     def get_output_text(self) -> str:
         index = self.tab_widget.currentIndex()
         if 0 <= index < len(self._set_payloads):
             return str(self._set_payloads[index].get("generated_output", "")).strip()
         return ""
 
+    def get_output_questions(self) -> List[QuestionItem]:
+        index = self.tab_widget.currentIndex()
+        if 0 <= index < len(self._set_payloads):
+            return list(self._set_payloads[index].get("questions", []))
+        return []
+
     def get_current_set_payload(self):
         index = self.tab_widget.currentIndex()
         if 0 <= index < len(self._set_payloads):
@@ -521,54 +600,3 @@ class OutputArea(QWidget):
         payload = dict(self._set_payloads[tab_index])
         payload["_tab_index"] = tab_index
         self.set_delete_requested.emit(payload)
-
-    def _parse_generated_output(self, generated_output: str) -> List[Dict]:
-        blocks = [block.strip() for block in generated_output.split("\n\n") if block.strip()]
-        parsed_items: List[Dict] = []
-
-        for block in blocks:
-            lines = [line.strip() for line in block.splitlines() if line.strip()]
-            if not lines:
-                continue
-
-            question_line = lines[0]
-            if ". " in question_line:
-                question_text = question_line.split(". ", 1)[1].strip()
-            else:
-                question_text = question_line
-
-            lowered_question_text = question_text.lower()
-            legacy_tf_prefix = "true or false:"
-            if lowered_question_text.startswith(legacy_tf_prefix):
-                question_text = question_text[len(legacy_tf_prefix):].strip()
-
-            choices = [line for line in lines if line.startswith(("A)", "B)", "C)", "D)"))]
-            answer_line = ""
-            for line in lines:
-                if line.lower().startswith("answer:"):
-                    answer_line = line.split(":", 1)[1].strip()
-
-            normalized_answer = answer_line.strip().lower()
-            is_true_false_answer = normalized_answer in {"true", "false", "tama", "mali"}
-
-            question_type = "essay"
-            if choices:
-                question_type = "multiple_choice"
-            elif is_true_false_answer:
-                question_type = "true_or_false"
-            elif answer_line:
-                question_type = "identification"
-
-            if question_type == "essay":
-                answer_line = ""
-
-            parsed_items.append(
-                {
-                    "question_type": question_type,
-                    "question": question_text,
-                    "choices": choices,
-                    "answer": answer_line,
-                }
-            )
-
-        return parsed_items
@@ -0,0 +1,171 @@
+import argparse
+import io
+import os
+import time
+from typing import Dict, List
+
+import torch
+
+from question_generator import QuestionGenerator
+
+SAMPLE_TEXT = (
+    "Maria walked to the old village market every morning before dawn. "
+    "She carried a basket of mangoes from her grandmother's garden near the Pasig River. "
+    "The merchants of Santa Cruz greeted her warmly because she always sold the sweetest fruit. "
+    "One day a stranger named Don Ramon offered her ten silver coins for the whole basket. "
+    "Maria refused because the mangoes were promised to the sick children of the village. "
+    "The stranger became angry and followed her along the dusty road to the chapel. "
+    "At the chapel, Father Miguel welcomed Maria and listened to her story. "
+    "The priest told Don Ramon that kindness was worth more than silver."
+)
+
+
+def _load_text(text_file: str) -> str:
+    if not text_file:
+        return SAMPLE_TEXT
+    with open(text_file, "r", encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _build_generator(**kwargs) -> QuestionGenerator:
+    os.environ["READINGQUIZ_GENERATION_CACHE"] = ""
+    os.environ["READINGQUIZ_TRANSLATION_CACHE"] = ""
+    return QuestionGenerator(**kwargs)
+
+
+def _plan_pairs(generator: QuestionGenerator, text: str, max_pairs: int) -> List[tuple]:
+    sentences = generator._split_sentences(generator._normalize_text(text))
+    candidates = generator._plan_question_candidates(sentences)
+    return [(item["sentence"], item["answer"]) for item in candidates[:max_pairs]]
+
+
+def _model_size_mb(model):
+    if not hasattr(model, "state_dict"):
+        return None
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def _time_decode(generator: QuestionGenerator, pairs: List[tuple], runs: int, decoding_profile: str = "") -> Dict:
+    decoding_settings = generator._get_decoding_settings(decoding_profile, "question")
+    prompts = [generator._build_question_prompt(sentence, answer) for sentence, answer in pairs]
+    generator._decode_prompts_in_batches(prompts[:1], decoding_settings)
+
+    durations = []
+    raw_questions = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        raw_questions = generator._decode_prompts_in_batches(prompts, decoding_settings)
+        durations.append(time.perf_counter() - started)
+
+    accepted = [
+        generator._postprocess_generated_question(raw_question, sentence, answer)
+        for raw_question, (sentence, answer) in zip(raw_questions, pairs)
+    ]
+    return {
+        "seconds": min(durations),
+        "raw_questions": raw_questions,
+        "accepted": sum(1 for question in accepted if question),
+    }
+
+
+def _compare_generators(args, text: str, baseline: tuple, candidate: tuple):
+    baseline_label, baseline_kwargs = baseline
+    candidate_label, candidate_kwargs = candidate
+
+    baseline_generator = _build_generator(**baseline_kwargs)
+    pairs = _plan_pairs(baseline_generator, text, args.max_pairs)
+    if not pairs:
+        print("No candidate pairs found in the input text.")
+        return
+
+    print(f"Benchmarking {len(pairs)} (sentence, answer) pairs, best of {args.runs} run(s)")
+    baseline_result = _time_decode(baseline_generator, pairs, args.runs)
+    baseline_size = _model_size_mb(baseline_generator.model)
+    baseline_generator.release_models()
+    del baseline_generator
+
+    candidate_generator = _build_generator(**candidate_kwargs)
+    candidate_result = _time_decode(candidate_generator, pairs, args.runs)
+    candidate_size = _model_size_mb(candidate_generator.model)
+
+    matches = sum(
+        1
+        for baseline_question, candidate_question in zip(baseline_result["raw_questions"], candidate_result["raw_questions"])
+        if baseline_question.strip().lower() == candidate_question.strip().lower()
+    )
+
+    print(f"{'mode':<10}{'seconds':>10}{'per pair':>10}{'accepted':>10}{'size MB':>10}")
+    for label, result, size in (
+        (baseline_label, baseline_result, baseline_size),
+        (candidate_label, candidate_result, candidate_size),
+    ):
+        per_pair = result["seconds"] / len(pairs)
+        size_text = f"{size:.1f}" if size is not None else "-"
+        print(f"{label:<10}{result['seconds']:>10.2f}{per_pair:>10.3f}{result['accepted']:>10}{size_text:>10}")
+    print(f"Speedup: {baseline_result['seconds'] / max(candidate_result['seconds'], 1e-9):.2f}x")
+    print(f"Identical questions: {matches}/{len(pairs)}")
+
+    if args.show_diffs:
+        for (sentence, answer), baseline_question, candidate_question in zip(
+            pairs, baseline_result["raw_questions"], candidate_result["raw_questions"]
+        ):
+            if baseline_question.strip().lower() == candidate_question.strip().lower():
+                continue
+            print(
+                f"\nAnswer: {answer}\nContext: {sentence}\n"
+                f"  {baseline_label}: {baseline_question}\n  {candidate_label}: {candidate_question}"
+            )
+
+
+def _compare_profiles(args, text: str):
+    generator = _build_generator()
+    pairs = _plan_pairs(generator, text, args.max_pairs)
+    if not pairs:
+        print("No candidate pairs found in the input text.")
+        return
+
+    print(f"Benchmarking {len(pairs)} (sentence, answer) pairs, best of {args.runs} run(s)")
+    print(f"{'profile':<10}{'beams':>7}{'new tok':>9}{'seconds':>10}{'per pair':>10}{'accepted':>10}{'rate':>8}")
+    for profile_name, profile in generator.decoding_profiles.items():
+        result = _time_decode(generator, pairs, args.runs, profile_name)
+        question_settings = profile["question"]
+        per_pair = result["seconds"] / len(pairs)
+        acceptance_rate = result["accepted"] / len(pairs)
+        print(
+            f"{profile_name:<10}{question_settings['num_beams']:>7}{question_settings['max_new_tokens']:>9}"
+            f"{result['seconds']:>10.2f}{per_pair:>10.3f}{result['accepted']:>10}{acceptance_rate:>8.0%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark question generation inference settings")
+    parser.add_argument("mode", choices=["quantization", "backend", "profiles"], help="What to compare")
+    parser.add_argument("--text-file", default="", help="UTF-8 text to plan candidates from (default: built-in sample)")
+    parser.add_argument("--max-pairs", type=int, default=16)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--show-diffs", action="store_true", help="Print pairs whose questions differ")
+    args = parser.parse_args()
+
+    text = _load_text(args.text_file)
+    if args.mode == "quantization":
+        _compare_generators(
+            args,
+            text,
+            ("float32", {"quantization": "none", "backend": "torch"}),
+            ("int8", {"quantization": "int8", "backend": "torch"}),
+        )
+    elif args.mode == "backend":
+        _compare_generators(
+            args,
+            text,
+            ("torch", {"quantization": "none", "backend": "torch"}),
+            ("onnx", {"quantization": "none", "backend": "onnx"}),
+        )
+    elif args.mode == "profiles":
+        _compare_profiles(args, text)
+
+
+if __name__ == "__main__":
+    main()
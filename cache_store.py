@@ -0,0 +1,136 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CacheStore:
+    def __init__(self, database_path: str, table_name: str, max_entries: int = 20000):
+        self.database_path = database_path
+        self.table_name = table_name
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._initialize_database()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        serialized = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.database_path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _initialize_database(self):
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                );
+                """
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_last_used ON {self.table_name} (last_used)"
+            )
+            conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        found = {}
+        with self._lock, self._connect() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT cache_key, value FROM {self.table_name} WHERE cache_key IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    found[row["cache_key"]] = row["value"]
+
+            if found:
+                now = time.time()
+                cursor.executemany(
+                    f"UPDATE {self.table_name} SET last_used = ? WHERE cache_key = ?",
+                    [(now, key) for key in found],
+                )
+            conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def put(self, key: str, value: str):
+        self.put_many([(key, value)])
+
+    def put_many(self, items: List[Tuple[str, str]]):
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                f"""
+                INSERT INTO {self.table_name} (cache_key, value, last_used) VALUES (?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET value = excluded.value, last_used = excluded.last_used
+                """,
+                [(key, value, now) for key, value in items],
+            )
+            self._evict_overflow(cursor)
+            conn.commit()
+
+    def _evict_overflow(self, cursor):
+        cursor.execute(f"SELECT COUNT(*) AS count FROM {self.table_name}")
+        overflow = int(cursor.fetchone()["count"]) - self.max_entries
+        if overflow <= 0:
+            return
+
+        cursor.execute(
+            f"""
+            DELETE FROM {self.table_name}
+            WHERE cache_key IN (
+                SELECT cache_key FROM {self.table_name} ORDER BY last_used ASC LIMIT ?
+            )
+            """,
+            (overflow,),
+        )
+
+    def clear(self):
+        with self._lock, self._connect() as conn:
+            conn.execute(f"DELETE FROM {self.table_name}")
+            conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) AS count FROM {self.table_name}")
+            entries = int(cursor.fetchone()["count"])
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
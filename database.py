@@ -2,6 +2,8 @@ import json
 import sqlite3
 from typing import Dict, List, Optional
 
+from quiz_items import QuestionItem, render_question_items
+
 
 class NotebookDatabase:
     def __init__(self, database_path: str = "notebook.db"):
@@ -29,7 +31,8 @@ class NotebookDatabase:
                 true_or_false_qty INTEGER NOT NULL,
                 identification_qty INTEGER NOT NULL,
                 essay_qty INTEGER NOT NULL,
-                language TEXT NOT NULL CHECK (language IN ('English', 'Filipino'))
+                language TEXT NOT NULL CHECK (language IN ('English', 'Filipino')),
+                decoding_profile TEXT NULL
             );
             """,
             """
@@ -88,9 +91,14 @@ class NotebookDatabase:
             cursor = conn.cursor()
             for statement in create_tables:
                 cursor.execute(statement)
+
+            cursor.execute("PRAGMA table_info(question_setting)")
+            question_setting_columns = {row["name"] for row in cursor.fetchall()}
+            if "decoding_profile" not in question_setting_columns:
+                cursor.execute("ALTER TABLE question_setting ADD COLUMN decoding_profile TEXT NULL")
             conn.commit()
 
-    def save_notebook(self, name: str, settings: Dict, generated_output: str) -> Dict:
+    def save_notebook(self, name: str, settings: Dict, questions: List[QuestionItem]) -> Dict:
         notebook_name = name.strip()
         if not notebook_name:
             raise ValueError("Notebook name is required")
@@ -118,7 +126,7 @@ class NotebookDatabase:
             set_name = f"Set {next_set_index}"
 
             question_setting_id = self._insert_question_setting(cursor, settings)
-            quiz_id = self._insert_quiz(cursor, notebook_name, set_name, generated_output)
+            quiz_id = self._insert_quiz(cursor, notebook_name, set_name, questions)
 
             cursor.execute(
                 """
@@ -139,7 +147,7 @@ class NotebookDatabase:
             conn.commit()
             return {"notebook_id": notebook_id, "set_name": set_name}
 
-    def save_set_to_notebook(self, notebook_id: int, settings: Dict, generated_output: str) -> Optional[Dict]:
+    def save_set_to_notebook(self, notebook_id: int, settings: Dict, questions: List[QuestionItem]) -> Optional[Dict]:
         with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id, name FROM notebook WHERE id = ?", (notebook_id,))
@@ -158,7 +166,7 @@ class NotebookDatabase:
             set_name = f"Set {next_set_index}"
 
             question_setting_id = self._insert_question_setting(cursor, settings)
-            quiz_id = self._insert_quiz(cursor, notebook_name, set_name, generated_output)
+            quiz_id = self._insert_quiz(cursor, notebook_name, set_name, questions)
 
             cursor.execute(
                 """
@@ -185,8 +193,9 @@ class NotebookDatabase:
                 true_or_false_qty,
                 identification_qty,
                 essay_qty,
-                language
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                language,
+                decoding_profile
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 settings.get("file_input", ""),
@@ -200,25 +209,25 @@ class NotebookDatabase:
                 int(settings.get("identification_qty", 0)),
                 int(settings.get("essay_qty", 0)),
                 settings.get("language", "English"),
+                settings.get("decoding_profile") or None,
             ),
         )
         return cursor.lastrowid
 
-    def _insert_quiz(self, cursor, notebook_name: str, set_name: str, generated_output: str) -> int:
+    def _insert_quiz(self, cursor, notebook_name: str, set_name: str, questions: List[QuestionItem]) -> int:
         cursor.execute("INSERT INTO quiz (title) VALUES (?)", (f"{notebook_name} - {set_name}",))
         quiz_id = cursor.lastrowid
 
-        parsed_questions = self._parse_generated_output(generated_output)
-        for item in parsed_questions:
+        for item in questions:
             cursor.execute(
                 "INSERT INTO quiz_question (quiz_id, question_type, content) VALUES (?, ?, ?)",
-                (quiz_id, item["question_type"], item["question"]),
+                (quiz_id, item.question_type, item.question),
             )
             question_id = cursor.lastrowid
 
             choices_payload = {
-                "choices": item.get("choices", []),
-                "context": item.get("context", ""),
+                "choices": list(item.choices),
+                "context": item.context,
             }
             cursor.execute(
                 """
@@ -233,7 +242,7 @@ class NotebookDatabase:
                     quiz_id,
                     question_id,
                     json.dumps(choices_payload, ensure_ascii=False),
-                    item.get("answer", ""),
+                    item.answer,
                 ),
             )
 
@@ -436,7 +445,7 @@ class NotebookDatabase:
                         "set_name": set_row["set_name"],
                         "settings": settings,
                         "questions": questions,
-                        "generated_output": self._format_questions_for_display(questions),
+                        "generated_output": render_question_items(questions, settings["language"]),
                     }
                 )
 
@@ -499,7 +508,8 @@ class NotebookDatabase:
                 true_or_false_qty,
                 identification_qty,
                 essay_qty,
-                language
+                language,
+                decoding_profile
             FROM question_setting
             WHERE id = ?
             """,
@@ -519,6 +529,7 @@ class NotebookDatabase:
                 "identification_qty": 0,
                 "essay_qty": 0,
                 "language": "English",
+                "decoding_profile": "",
             }
 
         return {
@@ -533,9 +544,10 @@ class NotebookDatabase:
             "identification_qty": int(row["identification_qty"]),
             "essay_qty": int(row["essay_qty"]),
             "language": row["language"],
+            "decoding_profile": row["decoding_profile"] or "",
         }
 
-    def _fetch_questions(self, conn, quiz_id: int) -> List[Dict]:
+    def _fetch_questions(self, conn, quiz_id: int) -> List[QuestionItem]:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -578,89 +590,6 @@ class NotebookDatabase:
                 answer_value = ""
                 context_value = ""
 
-            questions.append(
-                {
-                    "question_type": question_type,
-                    "question": question_text,
-                    "choices": choices,
-                    "answer": answer_value,
-                    "context": context_value,
-                }
-            )
+            questions.append(QuestionItem(question_type, question_text, choices, answer_value, context_value))
 
         return questions
-
-    def _parse_generated_output(self, generated_output: str) -> List[Dict]:
-        blocks = [block.strip() for block in generated_output.split("\n\n") if block.strip()]
-        parsed_items = []
-
-        for block in blocks:
-            lines = [line.strip() for line in block.splitlines() if line.strip()]
-            if not lines:
-                continue
-
-            question_line = lines[0]
-            if ". " in question_line:
-                question_text = question_line.split(". ", 1)[1].strip()
-            else:
-                question_text = question_line
-
-            lowered_question_text = question_text.lower()
-            legacy_tf_prefix = "true or false:"
-            if lowered_question_text.startswith(legacy_tf_prefix):
-                question_text = question_text[len(legacy_tf_prefix):].strip()
-
-            choices = [line for line in lines if line.startswith(("A)", "B)", "C)", "D)"))]
-            answer_line = ""
-            context_line = ""
-            for line in lines:
-                if line.lower().startswith("answer:"):
-                    answer_line = line.split(":", 1)[1].strip()
-                if line.lower().startswith("context:"):
-                    context_line = line.split(":", 1)[1].strip()
-
-            normalized_answer = answer_line.strip().lower()
-            is_true_false_answer = normalized_answer in {"true", "false", "tama", "mali"}
-
-            question_type = "essay"
-            if choices:
-                question_type = "multiple_choice"
-            elif is_true_false_answer:
-                question_type = "true_or_false"
-            elif answer_line:
-                question_type = "identification"
-
-            if question_type == "essay":
-                answer_line = ""
-                context_line = ""
-
-            parsed_items.append(
-                {
-                    "question_type": question_type,
-                    "question": question_text,
-                    "choices": choices,
-                    "answer": answer_line,
-                    "context": context_line,
-                }
-            )
-
-        return parsed_items
-
-    def _format_questions_for_display(self, questions: List[Dict]) -> str:
-        output_lines = []
-        number = 1
-
-        for item in questions:
-            output_lines.append(f"{number}. {item['question']}")
-            for choice in item.get("choices", []):
-                output_lines.append(choice)
-            if item.get("question_type") == "essay":
-                output_lines.append("Note: Manual checking required.")
-            if item.get("question_type") != "essay" and item.get("answer"):
-                output_lines.append(f"Answer: {item['answer']}")
-            if item.get("question_type") != "essay" and item.get("context"):
-                output_lines.append(f"Context: {item['context']}")
-            output_lines.append("")
-            number += 1
-
-        return "\n".join(output_lines).strip()
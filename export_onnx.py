@@ -0,0 +1,21 @@
+import argparse
+
+from question_generator import QuestionGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the question generation model to ONNX for the onnxruntime backend")
+    parser.add_argument("--output-dir", default="", help="Defaults to an 'onnx' folder next to the resolved model")
+    args = parser.parse_args()
+
+    generator = QuestionGenerator(quantization="none", backend="torch")
+    output_dir = args.output_dir or generator.onnx_model_dir
+
+    print(f"Exporting {generator.model_name} to ONNX (encoder, decoder and decoder-with-past)...")
+    generator.export_onnx_model(output_dir)
+    print(f"Saved ONNX artifacts to: {output_dir}")
+    print("Enable them with READINGQUIZ_BACKEND=onnx")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
+import hashlib
 import os
 import importlib
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cache_store import CacheStore
+from ooxml_reader import OOXML_ERRORS, iter_docx_blocks, iter_pptx_slides
+from text_reader import iter_text_chunks
 
 try:
     import pymupdf
@@ -20,79 +29,236 @@ except ImportError:
     Presentation = None
 
 
+PDF_SHARD_PAGES = max(1, int(os.getenv("READINGQUIZ_PDF_SHARD_PAGES", "16")))
+PDF_WORKERS = int(os.getenv("READINGQUIZ_PDF_WORKERS", "0"))
+EXTRACTOR_VERSION = 4
+
+_pdf_executor = {"executor": None, "max_workers": 0}
+_pdf_executor_lock = threading.Lock()
+
+_extraction_cache = {"store": None, "ready": False}
+_extraction_cache_lock = threading.Lock()
+_content_digests = {}
+
+
+def get_extraction_cache():
+    with _extraction_cache_lock:
+        if not _extraction_cache["ready"]:
+            cache_path = os.getenv("READINGQUIZ_EXTRACTION_CACHE", "extraction_cache.db")
+            if cache_path:
+                _extraction_cache["store"] = CacheStore(
+                    cache_path,
+                    "extracted_text",
+                    max_entries=int(os.getenv("READINGQUIZ_EXTRACTION_CACHE_SIZE", "200")),
+                )
+            _extraction_cache["ready"] = True
+        return _extraction_cache["store"]
+
+
+def get_pdf_executor():
+    with _pdf_executor_lock:
+        if _pdf_executor["executor"] is None:
+            max_workers = max(1, PDF_WORKERS or min(4, os.cpu_count() or 1))
+            _pdf_executor["executor"] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pdf_executor["max_workers"] = max_workers
+        return _pdf_executor["executor"], _pdf_executor["max_workers"]
+
+
+def shutdown_pdf_executor():
+    with _pdf_executor_lock:
+        executor = _pdf_executor["executor"]
+        _pdf_executor["executor"] = None
+        _pdf_executor["max_workers"] = 0
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def file_content_digest(path, size, mtime_ns):
+    stat_key = (path, size, mtime_ns)
+    digest = _content_digests.get(stat_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        _content_digests[stat_key] = digest
+    return digest
+
+
+def load_pdf_module():
+    if pymupdf is not None:
+        return pymupdf
+
+    try:
+        return importlib.import_module("pymupdf")
+    except ImportError:
+        try:
+            return importlib.import_module("fitz")
+        except ImportError:
+            return None
+
+
+def extract_pdf_page_range(path, start, stop):
+    pdf_module = load_pdf_module()
+    with pdf_module.open(path) as doc:
+        return [doc[page_number].get_text("text") for page_number in range(start, stop)]
+
+
 class ExtractText:
     def __init__(self, path):
         self.path = path or ""
         self.text_format = ""
 
-    def convert(self) -> str:
+    def convert(self, max_chars=None, max_pages=None) -> str:
+        if max_chars or max_pages:
+            self.text_format = self._collect_chunks(max_chars, max_pages)
+            return self.text_format
+
+        cache = get_extraction_cache()
+        cache_key = self._extraction_cache_key() if cache is not None else None
+        if cache_key is not None:
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                self.text_format = cached_text
+                return cached_text
+
+        self.text_format = self._collect_chunks()
+        if cache_key is not None and self.text_format:
+            cache.put(cache_key, self.text_format)
+        return self.text_format
+
+    def _collect_chunks(self, max_chars=None, max_pages=None) -> str:
+        chunks = []
+        collected_chars = 0
+        for chunk in self.iter_chunks():
+            chunks.append(chunk)
+            collected_chars += len(chunk) + 1
+            if max_pages and len(chunks) >= max_pages:
+                break
+            if max_chars and collected_chars >= max_chars:
+                break
+        return "\n".join(chunks).strip()
+
+    def _extraction_cache_key(self):
+        try:
+            path = os.path.abspath(self.path)
+            file_stat = os.stat(path)
+            digest = file_content_digest(path, file_stat.st_size, file_stat.st_mtime_ns)
+        except OSError:
+            return None
+        return CacheStore.make_key("extract", EXTRACTOR_VERSION, path, file_stat.st_size, file_stat.st_mtime_ns, digest)
+
+    def iter_chunks(self):
         file_ext = os.path.splitext(self.path)[1].lower()
 
         if file_ext == ".txt":
-            self.text_file(self.path)
-        elif file_ext == ".pdf":
-            self.pdf_file(self.path)
-        elif file_ext in (".doc", ".docx"):
-            self.doc_file(self.path)
-        elif file_ext in (".ppt", ".pptx"):
-            self.ppt_file(self.path)
-
-        return self.text_format.strip()
+            return iter_text_chunks(self.path)
+        if file_ext == ".pdf":
+            return self.iter_pdf_pages(self.path)
+        if file_ext in (".doc", ".docx"):
+            return self.iter_doc_paragraphs(self.path)
+        if file_ext in (".ppt", ".pptx"):
+            return self.iter_ppt_slides(self.path)
+        return iter(())
 
     def text_output(self) -> str:
         return self.convert()
 
     def text_file(self, path):
-        try:
-            with open(path, "r", encoding="utf-8") as text_file:
-                self.text_format = text_file.read()
-        except UnicodeDecodeError:
-            with open(path, "r", encoding="latin-1") as text_file:
-                self.text_format = text_file.read()
+        self.text_format = "\n".join(iter_text_chunks(path))
 
     def pdf_file(self, path):
+        self.text_format = "".join(f"{page_text}\n" for page_text in self.iter_pdf_pages(path))
+
+    def iter_pdf_pages(self, path):
         pdf_module = self._load_pdf_module()
         if pdf_module is None:
             raise RuntimeError("PDF extraction requires 'pymupdf'. Install dependencies from requirements.txt")
 
-        doc = pdf_module.open(path)
-        for page in doc:
-            self.text_format += page.get_text("text")
-            self.text_format += "\n"
+        with pdf_module.open(path) as doc:
+            page_count = doc.page_count
+            if page_count <= PDF_SHARD_PAGES * 2:
+                for page in doc:
+                    yield page.get_text("text")
+                return
+
+        shards = [(start, min(start + PDF_SHARD_PAGES, page_count)) for start in range(0, page_count, PDF_SHARD_PAGES)]
+        executor, max_workers = get_pdf_executor()
+        pending = deque()
+        try:
+            next_shard = 0
+            while pending or next_shard < len(shards):
+                while next_shard < len(shards) and len(pending) <= max_workers:
+                    start, stop = shards[next_shard]
+                    pending.append(executor.submit(extract_pdf_page_range, path, start, stop))
+                    next_shard += 1
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
     def doc_file(self, path):
+        self.text_format = "".join(f"{paragraph}\n" for paragraph in self.iter_doc_paragraphs(path))
+
+    def iter_doc_paragraphs(self, path):
+        yielded = 0
+        try:
+            for block in iter_docx_blocks(path):
+                yield block
+                yielded += 1
+            return
+        except OOXML_ERRORS as error:
+            if yielded:
+                raise
+            print(f"Fast Word reader unavailable for {path}: {error}")
+
+        yield from self._iter_docx_library_paragraphs(path)
+
+    def _iter_docx_library_paragraphs(self, path):
         if docx is None:
             raise RuntimeError("Word extraction requires 'python-docx'. Install dependencies from requirements.txt")
         doc = docx.Document(path)
         for para in doc.paragraphs:
             if para.text:
-                self.text_format += para.text + "\n"
+                yield para.text
 
     def ppt_file(self, path):
+        self.text_format = "\n".join(self.iter_ppt_slides(path))
+
+    def iter_ppt_slides(self, path):
+        yielded = 0
+        try:
+            for slide_text in iter_pptx_slides(path):
+                yield slide_text
+                yielded += 1
+            return
+        except OOXML_ERRORS as error:
+            if yielded:
+                raise
+            print(f"Fast PowerPoint reader unavailable for {path}: {error}")
+
+        yield from self._iter_pptx_library_slides(path)
+
+    def _iter_pptx_library_slides(self, path):
         if Presentation is None:
             raise RuntimeError("PowerPoint extraction requires 'python-pptx'. Install dependencies from requirements.txt")
         prs = Presentation(path)
-        text_runs = []
 
         for slide in prs.slides:
+            text_runs = []
             for shape in slide.shapes:
                 if not shape.has_text_frame:
                     continue
                 for paragraph in shape.text_frame.paragraphs:
                     for run in paragraph.runs:
-                        text_runs.append(run.text)
-        self.text_format = "\n".join([value for value in text_runs if value])
+                        if run.text:
+                            text_runs.append(run.text)
+            if text_runs:
+                yield "\n".join(text_runs)
 
     def _load_pdf_module(self):
-        if pymupdf is not None:
-            return pymupdf
-
-        try:
-            return importlib.import_module("pymupdf")
-        except ImportError:
-            try:
-                return importlib.import_module("fitz")
-            except ImportError:
-                return None
-
-          
\ No newline at end of file
+        return load_pdf_module()
@@ -0,0 +1,51 @@
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+DEFAULT_GLOSSARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "glossary.json")
+
+
+class Glossary:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("READINGQUIZ_GLOSSARY", "") or DEFAULT_GLOSSARY_PATH
+        self.version = 1
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.normalized_entries: Dict[str, Dict[str, str]] = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            print(f"Glossary not found: {self.path}")
+            return
+
+        with open(self.path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+
+        self.version = int(data.get("version", 1))
+        for direction, entries in data.get("entries", {}).items():
+            for source_text, translated_text in entries.items():
+                self._remember(direction, source_text, translated_text)
+
+    def _remember(self, direction: str, source_text: str, translated_text: str):
+        self.entries.setdefault(direction, {})[source_text] = translated_text
+        self.normalized_entries.setdefault(direction, {}).setdefault(source_text.casefold(), translated_text)
+
+    def lookup_many(self, direction: str, texts: Iterable[str]) -> Dict[str, str]:
+        found = {}
+        exact_entries = self.entries.get(direction, {})
+        normalized_entries = self.normalized_entries.get(direction, {})
+        for text in texts:
+            if text in exact_entries:
+                found[text] = exact_entries[text]
+                continue
+
+            translated_text = normalized_entries.get(text.casefold())
+            if translated_text is not None:
+                found[text] = self._match_case(text, translated_text)
+
+        return found
+
+    def _match_case(self, source_text: str, translated_text: str) -> str:
+        if source_text[:1].isupper() and translated_text[:1].islower():
+            return translated_text[:1].upper() + translated_text[1:]
+        return translated_text
@@ -0,0 +1,114 @@
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STOP_WORD = 1 << 0
+CORE_STOP_WORD = 1 << 1
+WEAK_ANSWER = 1 << 2
+LOW_VALUE_ANSWER = 1 << 3
+COMMON_VERB = 1 << 4
+FILIPINO_FUNCTION = 1 << 5
+PERSON_MARKER = 1 << 6
+PLACE_MARKER = 1 << 7
+CREATURE_MARKER = 1 << 8
+TITLE_MARKER = 1 << 9
+PASSAGE_MARKER = 1 << 10
+
+ANY_STOP_WORD = STOP_WORD | FILIPINO_FUNCTION
+UNINFORMATIVE = ANY_STOP_WORD | WEAK_ANSWER | LOW_VALUE_ANSWER
+
+WORD_CLASSES = {
+    "stop_words": STOP_WORD,
+    "core_stop_words": CORE_STOP_WORD,
+    "weak_answer_words": WEAK_ANSWER,
+    "low_value_answer_words": LOW_VALUE_ANSWER,
+    "common_verb_tokens": COMMON_VERB,
+    "filipino_function_words": FILIPINO_FUNCTION,
+    "person_markers": PERSON_MARKER,
+    "place_markers": PLACE_MARKER,
+    "creature_markers": CREATURE_MARKER,
+    "title_markers": TITLE_MARKER,
+    "passage_markers": PASSAGE_MARKER,
+}
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9']+")
+WORD_PATTERN = re.compile(r"[A-Za-z']+")
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "lexicon.json")
+
+
+class Lexicon:
+    def __init__(
+        self,
+        word_classes: Dict[str, Iterable[str]],
+        semantic_pools: Optional[Dict[str, List[str]]] = None,
+        entity_fallback_pools: Optional[Dict[str, List[str]]] = None,
+        version: int = 1,
+    ):
+        self.version = version
+        self.table: Dict[str, int] = {}
+        for class_name, words in word_classes.items():
+            if class_name not in WORD_CLASSES:
+                raise ValueError(f"Unknown lexicon word class: {class_name}")
+            flag = WORD_CLASSES[class_name]
+            for word in words:
+                token = str(word).strip().lower()
+                if token:
+                    self.table[token] = self.table.get(token, 0) | flag
+
+        self.semantic_pools = {name: list(pool) for name, pool in (semantic_pools or {}).items()}
+        self.semantic_pool_sets = {
+            name: frozenset(item.lower() for item in pool) for name, pool in self.semantic_pools.items()
+        }
+        self.entity_fallback_pools = {name: list(pool) for name, pool in (entity_fallback_pools or {}).items()}
+
+    @classmethod
+    def load(cls, paths=None) -> "Lexicon":
+        if paths is None:
+            paths = os.getenv("READINGQUIZ_LEXICON", "") or DEFAULT_LEXICON_PATH
+        if isinstance(paths, str):
+            paths = [path for path in paths.split(os.pathsep) if path.strip()]
+
+        word_classes: Dict[str, List[str]] = {}
+        semantic_pools: Dict[str, List[str]] = {}
+        entity_fallback_pools: Dict[str, List[str]] = {}
+        version = 0
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            version = max(version, int(data.get("version", 1)))
+            for class_name, words in data.get("word_classes", {}).items():
+                word_classes.setdefault(class_name, []).extend(words)
+            for merged_pools, section in (
+                (semantic_pools, data.get("semantic_pools", {})),
+                (entity_fallback_pools, data.get("entity_fallback_pools", {})),
+            ):
+                for pool_name, pool in section.items():
+                    merged_pool = merged_pools.setdefault(pool_name, [])
+                    merged_pool.extend(item for item in pool if item not in merged_pool)
+
+        return cls(word_classes, semantic_pools, entity_fallback_pools, version or 1)
+
+    def flags(self, token: str) -> int:
+        return self.table.get(token, 0)
+
+    def has(self, token: str, mask: int) -> bool:
+        return bool(self.table.get(token, 0) & mask)
+
+    def words(self, mask: int) -> frozenset:
+        return frozenset(token for token, flags in self.table.items() if flags & mask)
+
+    def classify(self, text: str, pattern=TOKEN_PATTERN) -> List[Tuple[str, int]]:
+        table = self.table
+        return [(token, table.get(token, 0)) for token in pattern.findall(text.lower())]
+
+    def combined_flags(self, text: str, pattern=TOKEN_PATTERN) -> int:
+        table = self.table
+        combined = 0
+        for token in pattern.findall(text.lower()):
+            combined |= table.get(token, 0)
+        return combined
+
+    def in_pool(self, pool_name: str, text: str) -> bool:
+        return text.lower() in self.semantic_pool_sets.get(pool_name, ())
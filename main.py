@@ -1,107 +1,23 @@
+import multiprocessing
 import sys
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QFont, QIcon, QLinearGradient, QPainter, QPen
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QMessageBox, QVBoxLayout, QWidget
-
-from ai_output import OutputArea
-from database import NotebookDatabase
-from question_generator import QuestionGenerator
-from question_setting import QuestionSetting, SideBarNotebook
-
-
-class SplashScreen(QWidget):
-    finished = Signal()
-
-    def __init__(self):
-        super().__init__()
-        self.progress = 0
-        self.setFixedSize(420, 320)
-        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_progress)
-        self._timer.start(20)
-
-    def showEvent(self, event):
-        super().showEvent(event)
-        screen = self.screen() or QApplication.primaryScreen()
-        if screen:
-            geometry = screen.availableGeometry()
-            self.move(
-                geometry.center().x() - (self.width() // 2),
-                geometry.center().y() - (self.height() // 2),
-            )
 
-    def _update_progress(self):
-        self.progress = min(100, self.progress + 1)
-        self.update()
-        if self.progress >= 100:
-            self._timer.stop()
-            QTimer.singleShot(120, self._finish)
-
-    def _finish(self):
-        self.finished.emit()
-        self.close()
-
-    def paintEvent(self, event):
-        _ = event
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        circle_size = 220
-        x = (self.width() - circle_size) // 2
-        y = (self.height() - circle_size) // 2
-
-        shadow_offset = 6
-        shadow_size = circle_size + 8
-        shadow_x = x - 4 + shadow_offset
-        shadow_y = y - 4 + shadow_offset
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(0, 0, 0, 90))
-        painter.drawEllipse(shadow_x, shadow_y, shadow_size, shadow_size)
-
-        painter.setPen(Qt.NoPen)
-        inner_gap = 18
-        fill_x = x + inner_gap
-        fill_y = y + inner_gap
-        fill_size = circle_size - (inner_gap * 2)
-        fill_gradient = QLinearGradient(fill_x, fill_y, fill_x + fill_size, fill_y + fill_size)
-        fill_gradient.setColorAt(0.0, QColor("#EDF0D8"))
-        fill_gradient.setColorAt(1.0, QColor("#CFE3FF"))
-        painter.setBrush(fill_gradient)
-        painter.drawEllipse(fill_x, fill_y, fill_size, fill_size)
-
-        base_pen = QPen(QColor("#2c3146"), 12)
-        base_pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(base_pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(x, y, circle_size, circle_size)
-
-        progress_pen = QPen(QColor("#ff5cb8"), 12)
-        progress_pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(progress_pen)
-        start_angle = 90 * 16
-        span_angle = int(-360 * 16 * (self.progress / 100.0))
-        painter.drawArc(x, y, circle_size, circle_size, start_angle, span_angle)
-
-        painter.setPen(QColor("#111111"))
-        painter.setFont(QFont("Segoe UI", 9))
-        painter.drawText(x, y + 72, circle_size, 20, Qt.AlignCenter, "ReadingQuizAI")
-
-        painter.setPen(QColor("#ff7ac4"))
-        painter.setFont(QFont("Segoe UI", 32, QFont.Bold))
-        painter.drawText(x, y + 92, circle_size, 52, Qt.AlignCenter, f"{self.progress}%")
-
-        painter.setPen(QColor("#b7bbca"))
-        painter.setFont(QFont("Segoe UI", 10))
-        painter.drawText(x, y + 170, circle_size, 20, Qt.AlignCenter, "loading...")
+def main():
+    from PySide6.QtCore import QSettings, QTimer
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QHBoxLayout, QMessageBox, QVBoxLayout, QWidget
 
+    from ai_output import OutputArea
+    from database import NotebookDatabase
+    from extract_text import shutdown_pdf_executor
+    from question_generator import QuestionGenerator
+    from question_setting import QuestionSetting, SideBarNotebook
+    from splash_screen import SplashScreen
+    from workers import GenerationWorker, ModelLoaderWorker, TranslationPrefetchWorker
 
-if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(shutdown_pdf_executor)
 
     window_icon = None
     logo_path = Path(__file__).resolve().parent / "img" / "READY.png"
@@ -142,7 +58,20 @@ if __name__ == "__main__":
     sidebar_notebook.setObjectName("notebookContainer")
 
     database = NotebookDatabase()
-    generator_holder = {"instance": None}
+    generator_holder = {"instance": None, "loading": True, "pending_payload": None, "worker": None}
+    app_settings = QSettings("ReadingQuizAI", "READY")
+    translation_prefetch = {
+        "requested": app_settings.value("last_language", "") == "Filipino",
+        "worker": None,
+        "done": False,
+    }
+    generation_stage_labels = {
+        "window": "Reading section",
+        "extract": "Extracting answers",
+        "translate": "Translating",
+        "generate": "Generating questions",
+        "format": "Formatting",
+    }
     selected_notebook_id = {"value": None}
     selected_notebook_name = {"value": "New Notebook"}
 
@@ -185,20 +114,20 @@ if __name__ == "__main__":
             "essay": payload.get("essay_bool", False),
         }
 
+        if generator_holder["instance"] is None and generator_holder["loading"]:
+            generator_holder["pending_payload"] = payload
+            question_setting.set_generation_running(True)
+            question_setting.set_generation_progress("Waiting for the question model to finish loading...")
+            return
+
+        if generator_holder["worker"] is not None:
+            return
+
         try:
             if generator_holder["instance"] is None:
                 generator_holder["instance"] = QuestionGenerator()
-
-            generated_output = generator_holder["instance"].generate_questions(
-                input_text,
-                question_types,
-                quantities,
-                payload.get("language", "English"),
-                use_story_compression=True,
-            )
-            output_area.set_output_text(generated_output)
-            refresh_notebook_status()
         except Exception as error:
+            question_setting.set_generation_running(False)
             QMessageBox.critical(
                 notebook,
                 "Generation Error",
@@ -206,10 +135,153 @@ if __name__ == "__main__":
                 buttons=QMessageBox.Ignore,
                 defaultButton=QMessageBox.Ignore,
             )
+            return
+
+        worker = GenerationWorker(
+            generator_holder["instance"],
+            payload.get("input_documents") or input_text,
+            question_types,
+            quantities,
+            payload.get("language", "English"),
+            payload.get("decoding_profile"),
+        )
+        worker.progress_changed.connect(handle_generation_progress)
+        worker.question_ready.connect(handle_question_ready)
+        worker.completed.connect(handle_generation_completed)
+        worker.cancelled.connect(handle_generation_cancelled)
+        worker.failed.connect(handle_generation_failed)
+        worker.finished.connect(handle_generation_worker_finished)
+        generator_holder["worker"] = worker
+        question_setting.set_generation_running(True)
+        question_setting.set_generation_progress("Starting...")
+        output_area.begin_streaming()
+        worker.start()
+
+    def handle_generation_progress(stage, completed, total):
+        stage_label = generation_stage_labels.get(stage, stage.title())
+        if total > 0:
+            question_setting.set_generation_progress(f"{stage_label}: {completed}/{total}")
+        else:
+            question_setting.set_generation_progress(f"{stage_label}...")
+
+    def handle_question_ready(item):
+        output_area.append_streamed_question(item)
+        if not output_area.isVisible():
+            output_area.show()
+            output_area.raise_()
+
+    def handle_generation_completed(generated_output):
+        output_area.finish_streaming(generated_output)
+        refresh_notebook_status()
+
+    def handle_generation_cancelled(partial_output):
+        output_area.finish_streaming(partial_output)
+        refresh_notebook_status()
+
+    def handle_generation_failed(error_message):
+        output_area.finish_streaming(f"Error: {error_message}")
+        QMessageBox.critical(
+            notebook,
+            "Generation Error",
+            f"Failed to generate questions.\n{error_message}",
+            buttons=QMessageBox.Ignore,
+            defaultButton=QMessageBox.Ignore,
+        )
+
+    model_status_timer = QTimer(notebook)
+    model_status_timer.setInterval(30000)
+
+    def show_model_ready_status():
+        generator = generator_holder["instance"]
+        if generator is None:
+            return
+        resident_memory = generator.get_resident_model_memory()
+        if not resident_memory["models"]:
+            question_setting.set_model_status("Model: Idle (reloads on next use)")
+            return
+        resident_mb = resident_memory["total_bytes"] / (1024 * 1024)
+        question_setting.set_model_status(f"Model: Ready ({resident_mb:.0f} MB resident)")
+
+    model_status_timer.timeout.connect(show_model_ready_status)
+
+    def handle_generation_worker_finished():
+        worker = generator_holder["worker"]
+        generator_holder["worker"] = None
+        question_setting.set_generation_running(False)
+        show_model_ready_status()
+        if worker is not None:
+            worker.deleteLater()
+
+    def handle_cancel_generation():
+        worker = generator_holder["worker"]
+        if worker is not None and not worker.is_cancel_requested():
+            worker.cancel()
+            question_setting.set_generation_progress("Cancelling...")
+            return
+
+        if generator_holder["pending_payload"] is not None:
+            generator_holder["pending_payload"] = None
+            question_setting.set_generation_running(False)
+
+    def handle_model_progress(percent, stage_text):
+        question_setting.set_model_status(f"Model: {stage_text} ({percent}%)")
+
+    def start_translation_prefetch():
+        generator = generator_holder["instance"]
+        if generator is None or translation_prefetch["done"] or translation_prefetch["worker"] is not None:
+            return
+
+        worker = TranslationPrefetchWorker(generator)
+        worker.loaded.connect(handle_translation_prefetch_loaded)
+        worker.failed.connect(handle_translation_prefetch_failed)
+        worker.finished.connect(handle_translation_prefetch_finished)
+        translation_prefetch["worker"] = worker
+        worker.start()
+
+    def handle_translation_prefetch_loaded():
+        translation_prefetch["done"] = True
+        show_model_ready_status()
+
+    def handle_translation_prefetch_failed(error_message):
+        print(f"Background translation model loading failed: {error_message}")
+
+    def handle_translation_prefetch_finished():
+        worker = translation_prefetch["worker"]
+        translation_prefetch["worker"] = None
+        if worker is not None:
+            worker.deleteLater()
+
+    def handle_language_changed(language):
+        app_settings.setValue("last_language", language)
+        if language == "Filipino":
+            translation_prefetch["requested"] = True
+            start_translation_prefetch()
+
+    def handle_model_loaded(generator):
+        generator_holder["instance"] = generator
+        generator_holder["loading"] = False
+        show_model_ready_status()
+        if generator.model_manager.idle_timeout_seconds > 0:
+            model_status_timer.start()
+        if translation_prefetch["requested"]:
+            start_translation_prefetch()
+        pending_payload = generator_holder["pending_payload"]
+        generator_holder["pending_payload"] = None
+        if pending_payload is not None:
+            handle_generate(pending_payload)
+
+    def handle_model_failed(error_message):
+        generator_holder["loading"] = False
+        question_setting.set_model_status("Model: Not loaded")
+        print(f"Background model loading failed: {error_message}")
+        pending_payload = generator_holder["pending_payload"]
+        generator_holder["pending_payload"] = None
+        if pending_payload is not None:
+            handle_generate(pending_payload)
 
     def handle_save(payload):
-        generated_output = output_area.get_output_text()
-        if not generated_output:
+        questions = output_area.get_output_questions()
+        if not questions:
             QMessageBox.critical(
                 notebook,
                 "Error!",
@@ -221,7 +293,7 @@ if __name__ == "__main__":
 
         try:
             if selected_notebook_id["value"] is not None:
-                save_result = database.save_set_to_notebook(selected_notebook_id["value"], payload, generated_output)
+                save_result = database.save_set_to_notebook(selected_notebook_id["value"], payload, questions)
                 if not save_result:
                     raise ValueError("Selected notebook no longer exists")
                 notebook_data = database.get_notebook_sets(save_result["notebook_id"])
@@ -230,7 +302,7 @@ if __name__ == "__main__":
                 notebook_name = question_setting.ask_notebook_name()
                 if not notebook_name:
                     return
-                save_result = database.save_notebook(notebook_name, payload, generated_output)
+                save_result = database.save_notebook(notebook_name, payload, questions)
 
             notebook_id = save_result["notebook_id"]
             set_name = save_result["set_name"]
@@ -425,6 +497,8 @@ if __name__ == "__main__":
         QMessageBox.information(notebook, "Renamed", "Notebook renamed successfully.")
 
     question_setting.generate_requested.connect(handle_generate)
+    question_setting.cancel_generation_requested.connect(handle_cancel_generation)
+    question_setting.language_changed.connect(handle_language_changed)
     question_setting.save_notebook_requested.connect(handle_save)
     question_setting.view_generated_requested.connect(handle_view_generated_requested)
     output_area.set_changed.connect(handle_output_set_changed)
@@ -458,6 +532,18 @@ if __name__ == "__main__":
     def show_main_window():
         window.show()
 
+    model_loader = ModelLoaderWorker()
+    model_loader.progress_changed.connect(splash.set_progress)
+    model_loader.progress_changed.connect(handle_model_progress)
+    model_loader.loaded.connect(handle_model_loaded)
+    model_loader.failed.connect(handle_model_failed)
+
     splash.finished.connect(show_main_window)
     splash.show()
+    model_loader.start()
     app.exec()
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,223 @@
+import gc
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+import torch
+
+
+def estimate_resource_bytes(resource) -> int:
+    if resource is None:
+        return 0
+    if isinstance(resource, (tuple, list)):
+        return sum(estimate_resource_bytes(part) for part in resource)
+    if torch.is_tensor(resource):
+        return resource.numel() * resource.element_size()
+
+    if hasattr(resource, "state_dict"):
+        total = 0
+        for value in resource.state_dict().values():
+            if torch.is_tensor(value):
+                total += value.numel() * value.element_size()
+            elif isinstance(value, (tuple, list)):
+                total += sum(estimate_resource_bytes(part) for part in value if torch.is_tensor(part))
+        return total
+
+    model_dir = getattr(resource, "model_save_dir", None)
+    if model_dir and os.path.isdir(str(model_dir)):
+        return sum(
+            os.path.getsize(os.path.join(str(model_dir), filename))
+            for filename in os.listdir(str(model_dir))
+            if ".onnx" in filename
+        )
+
+    return 0
+
+
+class ModelManager:
+    def __init__(self, memory_budget_mb=None, idle_timeout_seconds=None):
+        if memory_budget_mb is None:
+            memory_budget_mb = float(os.getenv("READINGQUIZ_MODEL_MEMORY_MB", "0"))
+        if idle_timeout_seconds is None:
+            idle_timeout_seconds = float(os.getenv("READINGQUIZ_MODEL_IDLE_SECONDS", "0"))
+
+        self.memory_budget_bytes = max(0, int(float(memory_budget_mb) * 1024 * 1024))
+        self.idle_timeout_seconds = max(0.0, float(idle_timeout_seconds))
+        self.load_count = 0
+        self.unload_count = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._sweeper = None
+        self._sweeper_stop = threading.Event()
+
+    def register(self, name: str, loader: Callable):
+        with self._lock:
+            self._entries[name] = {
+                "loader": loader,
+                "resource": None,
+                "size_bytes": 0,
+                "expected_bytes": 0,
+                "last_used": 0.0,
+                "users": 0,
+                "load_lock": threading.Lock(),
+            }
+
+    def is_loaded(self, name: str) -> bool:
+        with self._lock:
+            return self._entries[name]["resource"] is not None
+
+    def get(self, name: str, acquire: bool = False):
+        entry = self._entries[name]
+        while True:
+            with entry["load_lock"]:
+                if entry["resource"] is None:
+                    with self._lock:
+                        incoming_bytes = entry["expected_bytes"] or self.memory_budget_bytes
+                        self._enforce_budget(keep_name=name, incoming_bytes=incoming_bytes)
+                    started = time.perf_counter()
+                    resource = entry["loader"]()
+                    size_bytes = estimate_resource_bytes(resource)
+                    with self._lock:
+                        entry["resource"] = resource
+                        entry["size_bytes"] = size_bytes
+                        entry["expected_bytes"] = size_bytes
+                        self.load_count += 1
+                    print(
+                        f"Loaded {name} model ({size_bytes / (1024 * 1024):.0f} MB) "
+                        f"in {time.perf_counter() - started:.1f}s"
+                    )
+
+            with self._lock:
+                resource = entry["resource"]
+                if resource is None:
+                    continue
+                entry["last_used"] = time.monotonic()
+                if acquire:
+                    entry["users"] += 1
+                self._entries.move_to_end(name)
+                self._enforce_budget(keep_name=name)
+                break
+
+        self._ensure_sweeper()
+        return resource
+
+    @contextmanager
+    def use(self, name: str):
+        resource = self.get(name, acquire=True)
+        entry = self._entries[name]
+        try:
+            yield resource
+        finally:
+            with self._lock:
+                entry["users"] -= 1
+                entry["last_used"] = time.monotonic()
+
+    def unload(self, name: str) -> bool:
+        with self._lock:
+            entry = self._entries[name]
+            if entry["resource"] is None or entry["users"] > 0:
+                return False
+            self._release_entry(name, entry)
+        self._collect_garbage()
+        return True
+
+    def unload_idle(self):
+        if self.idle_timeout_seconds <= 0:
+            return []
+
+        unloaded = []
+        now = time.monotonic()
+        with self._lock:
+            for name, entry in self._entries.items():
+                if entry["resource"] is None or entry["users"] > 0:
+                    continue
+                if now - entry["last_used"] >= self.idle_timeout_seconds:
+                    self._release_entry(name, entry)
+                    unloaded.append(name)
+
+        if unloaded:
+            self._collect_garbage()
+        return unloaded
+
+    def resident_memory(self) -> Dict:
+        with self._lock:
+            models = {
+                name: entry["size_bytes"] for name, entry in self._entries.items() if entry["resource"] is not None
+            }
+        return {
+            "models": models,
+            "total_bytes": sum(models.values()),
+            "budget_bytes": self.memory_budget_bytes,
+            "loads": self.load_count,
+            "unloads": self.unload_count,
+        }
+
+    def _enforce_budget(self, keep_name: str, incoming_bytes: int = 0):
+        if self.memory_budget_bytes <= 0:
+            return
+
+        resident_bytes = incoming_bytes + sum(
+            entry["size_bytes"] for entry in self._entries.values() if entry["resource"] is not None
+        )
+        released = False
+        for name, entry in list(self._entries.items()):
+            if resident_bytes <= self.memory_budget_bytes:
+                break
+            if name == keep_name or entry["resource"] is None or entry["users"] > 0:
+                continue
+            resident_bytes -= entry["size_bytes"]
+            self._release_entry(name, entry)
+            released = True
+
+        if released:
+            self._collect_garbage()
+
+    def _release_entry(self, name: str, entry: Dict):
+        print(f"Unloading {name} model ({entry['size_bytes'] / (1024 * 1024):.0f} MB)")
+        entry["resource"] = None
+        entry["size_bytes"] = 0
+        self.unload_count += 1
+
+    def _collect_garbage(self):
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _ensure_sweeper(self):
+        if self.idle_timeout_seconds <= 0 or self._sweeper is not None:
+            return
+
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=_sweep_idle_models,
+                args=(weakref.ref(self), self._sweeper_stop, max(5.0, self.idle_timeout_seconds / 4)),
+                name="model-idle-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    def close(self):
+        self._sweeper_stop.set()
+        with self._lock:
+            for name, entry in self._entries.items():
+                if entry["resource"] is not None:
+                    self._release_entry(name, entry)
+        self._collect_garbage()
+
+    def __del__(self):
+        self._sweeper_stop.set()
+
+
+def _sweep_idle_models(manager_ref, stop_event, interval):
+    while not stop_event.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager.unload_idle()
+        del manager
@@ -0,0 +1,162 @@
+import posixpath
+import zipfile
+from typing import Dict, Iterator, List
+from xml.etree import ElementTree
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+DRAWING_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PRESENTATION_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+MARKUP_COMPATIBILITY_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+NOTES_SLIDE_RELATIONSHIP = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+
+OOXML_ERRORS = (zipfile.BadZipFile, KeyError, ElementTree.ParseError)
+
+
+def iter_docx_blocks(path) -> Iterator[str]:
+    with zipfile.ZipFile(path) as archive:
+        with archive.open("word/document.xml") as document_part:
+            yield from _iter_text_blocks(document_part, WORD_NS)
+
+
+def iter_pptx_slides(path) -> Iterator[str]:
+    with zipfile.ZipFile(path) as archive:
+        for slide_part in _presentation_slide_parts(archive):
+            blocks = []
+            with archive.open(slide_part) as slide_stream:
+                blocks.extend(_iter_text_blocks(slide_stream, DRAWING_NS))
+
+            notes_part = _related_part(archive, slide_part, NOTES_SLIDE_RELATIONSHIP)
+            if notes_part is not None:
+                with archive.open(notes_part) as notes_stream:
+                    blocks.extend(_iter_notes_blocks(notes_stream))
+
+            if blocks:
+                yield "\n".join(blocks)
+
+
+def _iter_text_blocks(source, namespace) -> Iterator[str]:
+    paragraph_tag = f"{{{namespace}}}p"
+    table_tag = f"{{{namespace}}}tbl"
+    row_tag = f"{{{namespace}}}tr"
+    cell_tag = f"{{{namespace}}}tc"
+    fallback_tag = f"{{{MARKUP_COMPATIBILITY_NS}}}Fallback"
+
+    open_rows: List[List[str]] = []
+    open_containers: List[List[str]] = []
+    fallback_depth = 0
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == row_tag:
+                open_rows.append([])
+            elif tag in (paragraph_tag, cell_tag):
+                open_containers.append([])
+            elif tag == fallback_tag:
+                fallback_depth += 1
+            continue
+
+        blocks = []
+        if tag == fallback_tag:
+            fallback_depth -= 1
+            element.clear()
+        elif tag == paragraph_tag:
+            nested_blocks = open_containers.pop()
+            text = _paragraph_text(element, namespace) if not fallback_depth else ""
+            element.clear()
+            if text.strip():
+                blocks.append(text)
+            blocks.extend(nested_blocks)
+        elif tag == cell_tag:
+            cell_text = " ".join(open_containers.pop())
+            if open_rows:
+                open_rows[-1].append(cell_text)
+        elif tag == row_tag:
+            row_text = " | ".join(cell for cell in open_rows.pop() if cell)
+            if row_text and not fallback_depth:
+                blocks.append(row_text)
+        elif tag == table_tag:
+            element.clear()
+
+        if open_containers:
+            open_containers[-1].extend(blocks)
+        else:
+            yield from blocks
+
+
+def _paragraph_text(paragraph, namespace) -> str:
+    text_tag = f"{{{namespace}}}t"
+    tab_tag = f"{{{namespace}}}tab"
+    break_tags = (f"{{{namespace}}}br", f"{{{namespace}}}cr")
+
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == text_tag:
+            parts.append(node.text or "")
+        elif node.tag == tab_tag:
+            parts.append("\t")
+        elif node.tag in break_tags:
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _iter_notes_blocks(source) -> Iterator[str]:
+    shape_tag = f"{{{PRESENTATION_NS}}}sp"
+    placeholder_path = f"{{{PRESENTATION_NS}}}nvSpPr/{{{PRESENTATION_NS}}}nvPr/{{{PRESENTATION_NS}}}ph"
+    paragraph_tag = f"{{{DRAWING_NS}}}p"
+
+    for _, element in ElementTree.iterparse(source, events=("end",)):
+        if element.tag != shape_tag:
+            continue
+        placeholder = element.find(placeholder_path)
+        if placeholder is not None and placeholder.get("type") == "body":
+            for paragraph in element.iter(paragraph_tag):
+                text = _paragraph_text(paragraph, DRAWING_NS)
+                if text.strip():
+                    yield text
+        element.clear()
+
+
+def _presentation_slide_parts(archive) -> List[str]:
+    relationships = _read_relationships(archive, "ppt/presentation.xml")
+    slide_id_tag = f"{{{PRESENTATION_NS}}}sldId"
+    relationship_id_attribute = f"{{{RELATIONSHIP_NS}}}id"
+
+    slide_parts = []
+    with archive.open("ppt/presentation.xml") as presentation_stream:
+        for _, element in ElementTree.iterparse(presentation_stream, events=("end",)):
+            if element.tag == slide_id_tag:
+                relationship = relationships.get(element.get(relationship_id_attribute))
+                if relationship is not None:
+                    slide_parts.append(relationship["part"])
+    return slide_parts
+
+
+def _related_part(archive, part_name, relationship_type):
+    for relationship in _read_relationships(archive, part_name).values():
+        if relationship["type"] == relationship_type:
+            return relationship["part"]
+    return None
+
+
+def _read_relationships(archive, part_name) -> Dict[str, Dict[str, str]]:
+    part_dir, part_file = posixpath.split(part_name)
+    relationships_name = posixpath.join(part_dir, "_rels", f"{part_file}.rels")
+    if relationships_name not in archive.namelist():
+        return {}
+
+    relationship_tag = f"{{{PACKAGE_RELATIONSHIP_NS}}}Relationship"
+    relationships = {}
+    with archive.open(relationships_name) as relationships_stream:
+        for _, element in ElementTree.iterparse(relationships_stream, events=("end",)):
+            if element.tag != relationship_tag or element.get("TargetMode") == "External":
+                continue
+            target = element.get("Target", "")
+            if target.startswith("/"):
+                target_part = target.lstrip("/")
+            else:
+                target_part = posixpath.normpath(posixpath.join(part_dir, target))
+            relationships[element.get("Id")] = {"type": element.get("Type", ""), "part": target_part}
+    return relationships
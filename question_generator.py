@@ -3,83 +3,190 @@ import torch
 import re
 import random
 import difflib
+import hashlib
 import os
 
+from cache_store import CacheStore
+from glossary import Glossary
+from lexicon import (
+    ANY_STOP_WORD,
+    COMMON_VERB,
+    CORE_STOP_WORD,
+    CREATURE_MARKER,
+    FILIPINO_FUNCTION,
+    LOW_VALUE_ANSWER,
+    PASSAGE_MARKER,
+    PERSON_MARKER,
+    PLACE_MARKER,
+    TITLE_MARKER,
+    UNINFORMATIVE,
+    WEAK_ANSWER,
+    WORD_PATTERN,
+    Lexicon,
+)
+from model_manager import ModelManager
+from quiz_items import QuestionItem, render_question_items
+
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+except ImportError:
+    ORTModelForSeq2SeqLM = None
+
+
+class GenerationCancelled(Exception):
+    pass
+
+
+class SentenceAnalysis:
+    __slots__ = (
+        "sentence",
+        "lowered",
+        "words",
+        "tokens",
+        "token_flags",
+        "capitalized",
+        "has_number",
+        "phrase_candidates",
+        "time_phrases",
+        "entity_categories",
+    )
+
+    def __init__(self, sentence, lexicon):
+        self.sentence = sentence
+        self.lowered = sentence.lower()
+        self.words = re.findall(r"[A-Za-z][A-Za-z'\-]*", sentence)
+        self.token_flags = lexicon.classify(self.lowered)
+        self.tokens = [token for token, _ in self.token_flags]
+        self.capitalized = [word[:1].isupper() for word in self.words]
+        self.has_number = bool(re.search(r"\b\d+\b", sentence))
+        self.phrase_candidates = []
+        self.time_phrases = []
+        self.entity_categories = {}
+
 
 class QuestionGenerator:
-    def __init__(self):
+    def __init__(self, quantization=None, backend=None, progress_callback=None):
+        self.progress_callback = progress_callback
         self.base_model_name = "mrm8488/t5-base-finetuned-question-generation-ap"
         self.local_model_dir = os.getenv("READINGQUIZ_MODEL_DIR", "models/qg_verify_full")
         self.model_name = self._resolve_model_source()
+        if quantization is None:
+            quantization = os.getenv("READINGQUIZ_QUANTIZE", "")
+        self.quantization_mode = str(quantization).strip().lower()
+        if self.quantization_mode in {"", "none", "float32"}:
+            self.quantization_mode = "none"
+        if self.quantization_mode not in {"none", "int8"}:
+            raise ValueError(f"Unsupported quantization mode: {quantization}")
+        if backend is None:
+            backend = os.getenv("READINGQUIZ_BACKEND", "torch")
+        self.inference_backend = str(backend).strip().lower() or "torch"
+        if self.inference_backend not in {"torch", "onnx"}:
+            raise ValueError(f"Unsupported inference backend: {backend}")
+        if self.inference_backend == "onnx" and self.quantization_mode != "none":
+            print("Int8 quantization applies to the torch backend only; ignoring it for ONNX")
+            self.quantization_mode = "none"
+        self.onnx_model_dir = self._resolve_onnx_model_dir()
         self.translation_model_names = {
             "tl_en": "Helsinki-NLP/opus-mt-tl-en",
             "en_tl": "Helsinki-NLP/opus-mt-en-tl",
         }
-        self.translation_resources = {}
-        self.translation_cache = {}
+        self.model_manager = ModelManager()
+        self.model_manager.register("question", self._load_question_model)
+        for direction in self.translation_model_names:
+            self.model_manager.register(
+                f"translation:{direction}",
+                lambda direction=direction: self._load_translation_resources(direction),
+            )
+        translation_cache_path = os.getenv("READINGQUIZ_TRANSLATION_CACHE", "translation_cache.db")
+        self.translation_cache = None
+        if translation_cache_path:
+            self.translation_cache = CacheStore(
+                translation_cache_path,
+                "translation_memory",
+                max_entries=int(os.getenv("READINGQUIZ_TRANSLATION_CACHE_SIZE", "50000")),
+            )
+        self.glossary = Glossary()
+        self.translation_batch_size = max(1, int(os.getenv("READINGQUIZ_TRANSLATION_BATCH_SIZE", "16")))
+        self.generation_batch_size = max(1, int(os.getenv("READINGQUIZ_BATCH_SIZE", "8")))
+        self.generation_wave_size = max(1, int(os.getenv("READINGQUIZ_WAVE_SIZE", "4")))
+        self.max_questions_per_sentence = 3
+        self.window_token_budget = max(32, int(os.getenv("READINGQUIZ_WINDOW_TOKENS", "256")))
+        self.model_decode_count = 0
+        self.last_generation_stats = {}
+        self.decoding_profiles = {
+            "quality": {
+                "question": {"num_beams": 4, "max_new_tokens": 48, "do_sample": False, "early_stopping": True},
+                "translation": {"num_beams": 4, "max_new_tokens": 192, "do_sample": False, "early_stopping": True},
+            },
+            "balanced": {
+                "question": {"num_beams": 2, "max_new_tokens": 32, "do_sample": False, "early_stopping": True},
+                "translation": {"num_beams": 2, "max_new_tokens": 160, "do_sample": False, "early_stopping": True},
+            },
+            "fast": {
+                "question": {"num_beams": 1, "max_new_tokens": 32, "do_sample": False},
+                "translation": {"num_beams": 1, "max_new_tokens": 128, "do_sample": False},
+            },
+        }
+        self.default_decoding_profile = self._resolve_decoding_profile(
+            os.getenv("READINGQUIZ_DECODING_PROFILE", "quality")
+        )
+        self.model_fingerprint = (
+            f"{self._compute_model_fingerprint()}|{self.inference_backend}|{self.quantization_mode}"
+        )
+        generation_cache_path = os.getenv("READINGQUIZ_GENERATION_CACHE", "generation_cache.db")
+        self.generation_cache = None
+        if generation_cache_path:
+            self.generation_cache = CacheStore(
+                generation_cache_path,
+                "question_generation",
+                max_entries=int(os.getenv("READINGQUIZ_GENERATION_CACHE_SIZE", "20000")),
+            )
         self.filipino_spelling_corrections = {
             "naggibigay": "nagbibigay",
             "nagbibgy": "nagbibigay",
             "iervesptop": "river stop",
         }
+        self.option_sentence_templates = {
+            "why": "It happened because {}.",
+            "how": "It happened through {}.",
+            "which": "The best choice is {}.",
+            "what": "It was {}.",
+        }
+        self.filipino_option_sentence_templates = {
+            "why": "Nangyari ito dahil {}.",
+            "how": "Nangyari ito sa pamamagitan ng {}.",
+            "which": "Ang pinakamainam na sagot ay {}.",
+            "what": "Ito ay {}.",
+        }
 
         print("Loading fine-tuned T5 model...")
         print(f"Model source: {self.model_name}")
+        print(f"Inference backend: {self.inference_backend}")
         print("(This may take a moment on first run as models download automatically from HuggingFace)")
 
         try:
+            self._report_load_progress(10, "Loading tokenizer")
             self.tokenizer = T5Tokenizer.from_pretrained(self.model_name)
-            self.model = T5ForConditionalGeneration.from_pretrained(self.model_name)
-
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            self.model.to(self.device)
+            self._report_load_progress(30, "Loading question model")
+            if self.inference_backend == "onnx":
+                self.device = torch.device("cpu")
+            else:
+                self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            self.model_manager.get("question")
             self.random = random.Random()
-            self.weak_answer_words = {
-                "while", "when", "where", "because", "although", "though", "since", "until", "after",
-                "before", "during", "through", "and", "or", "but", "then", "than", "just", "very",
-                "there", "their", "every", "some", "many", "much", "one", "two", "three"
-            }
-            self.low_value_answer_words = {
-                "everyone", "everything", "someone", "somebody", "anyone", "anybody", "nobody", "nothing",
-                "something", "anything", "least", "most", "said", "says", "say", "thing", "things",
-                "that", "this", "these", "those", "it", "its", "it's", "thats", "that's", "what",
-                "small", "large", "big", "dark", "light", "warm", "cold", "sat", "rest",
-                "who", "whom", "whose", "which", "where", "when", "why", "how", "pause", "paused"
-            }
-            self.common_verb_tokens = {
-                "is", "are", "was", "were", "be", "been", "being", "am",
-                "do", "does", "did", "has", "have", "had",
-                "go", "goes", "went", "gone", "come", "comes", "came",
-                "sit", "sits", "sat", "stand", "stands", "stood",
-                "look", "looks", "looked", "seem", "seems", "seemed",
-                "turn", "turns", "turned", "become", "becomes", "became",
-                "grow", "grows", "grew", "fall", "falls", "fell", "pause", "pauses", "paused",
-            }
-            self.filipino_function_words = {
-                "ang", "ng", "sa", "mga", "si", "ni", "kay", "kina", "nang", "na", "at",
-                "pero", "dahil", "kung", "kapag", "habang", "para", "mula", "ito", "iyan", "iyon",
-                "isang", "isang", "may", "mga", "rin", "din", "pa", "lamang", "lang"
-            }
-            self.semantic_pools = {
-                "time_of_day": ["morning", "afternoon", "evening", "night", "dawn", "noon", "midnight"],
-                "duration": ["minutes", "an hour", "hours", "a day", "days", "a week", "weeks", "long ago"],
-                "frequency": ["always", "often", "sometimes", "rarely", "never", "daily", "weekly"],
-                "number": ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten"],
-                "direction": ["left", "right", "north", "south", "east", "west", "up", "down"],
-                "generic_noun": [],
-            }
-            self.entity_fallback_pools = {
-                "person": ["the teacher", "the student", "the traveler", "the narrator", "the child", "the elder"],
-                "place": ["the house", "the village", "the town", "the road", "the market", "the garden"],
-                "creature": ["the bird", "the dog", "the cat", "the horse", "the wolf", "the lion"],
-                "title": ["the story", "the tale", "the legend", "the chapter", "the article", "the passage"],
-                "action": ["went silent", "turned pale", "fell asleep", "grew weak", "looked away", "stood still"],
-                "object": ["the lamp", "the key", "the box", "the letter", "the ring", "the book"],
-                "unknown": ["another detail", "another event", "another reason", "another object", "another place", "another person"],
-            }
+            self.lexicon = Lexicon.load()
+            self.weak_answer_words = self.lexicon.words(WEAK_ANSWER)
+            self.low_value_answer_words = self.lexicon.words(LOW_VALUE_ANSWER)
+            self.common_verb_tokens = self.lexicon.words(COMMON_VERB)
+            self.filipino_function_words = self.lexicon.words(FILIPINO_FUNCTION)
+            self.semantic_pools = self.lexicon.semantic_pools
+            self.entity_fallback_pools = self.lexicon.entity_fallback_pools
             self.story_compression_enabled = True
             self.allowed_question_starters = {"who", "what", "where", "when", "why", "how", "which"}
+            self.stop_words = self.lexicon.words(ANY_STOP_WORD)
+            self.sentence_analysis_cache = {}
 
+            self._report_load_progress(85, "Model loaded")
             print(f"✓ Model loaded successfully on {self.device}")
         except Exception as error:
             print(f"✗ Error loading model: {error}")
@@ -106,108 +213,440 @@ class QuestionGenerator:
 
         return self.base_model_name
 
-    def generate_questions(self, text, question_types, quantities, language="English", use_story_compression=None):
-        try:
-            text = self._normalize_text(text)
-            if len(text) > 1000:
-                text = text[:1000]
-
-            compression_enabled = self.story_compression_enabled if use_story_compression is None else bool(use_story_compression)
-            if compression_enabled:
-                text = self._compress_story_for_qg(text)
-
-            language_normalized = self._normalize_text(language).lower()
-            is_filipino_mode = language_normalized == "filipino"
-
-            if is_filipino_mode:
-                original_sentences = self._split_sentences(text)
-                translated_sentences = []
-                for sentence in original_sentences:
-                    translated_sentence = self._translate_text(sentence, "tl_en")
-                    translated_sentence = self._normalize_text(translated_sentence)
-                    if len(translated_sentence) > 20:
-                        translated_sentences.append(translated_sentence)
-                sentences = translated_sentences or self._split_sentences(text)
-            else:
-                sentences = self._split_sentences(text)
-            questions_data = []
-            seen_pairs = set()
-            target_count = sum(quantities.values())
+    def _report_load_progress(self, percent, stage):
+        if self.progress_callback is not None:
+            self.progress_callback(percent, stage)
 
-            for sentence in sentences:
-                if len(questions_data) >= target_count:
-                    break
+    def warm_up(self):
+        self._report_load_progress(90, "Warming up")
+        decoding_settings = self._get_decoding_settings(None, "question")
+        prompt = self._build_question_prompt(
+            "The teacher read a short story about a brave girl to the class in the morning.",
+            "the teacher",
+        )
+        self._decode_prompts_in_batches([prompt], decoding_settings)
+        self._report_load_progress(100, "Ready")
 
-                if not self._is_sentence_informative(sentence):
-                    continue
+    @property
+    def model(self):
+        return self.model_manager.get("question")
 
-                answers = self._extract_key_phrases(sentence)
-                scored_entries = []
+    def _load_question_model(self):
+        if self.inference_backend == "onnx":
+            return self._load_onnx_question_model()
 
-                for answer in answers:
-                    if len(questions_data) >= target_count:
-                        break
+        model = T5ForConditionalGeneration.from_pretrained(self.model_name)
+        model.to(self.device)
+        model.eval()
+        if self.quantization_mode == "int8":
+            model = self._apply_int8_quantization(model)
+        return model
+
+    def get_resident_model_memory(self):
+        return self.model_manager.resident_memory()
+
+    def release_models(self):
+        self.model_manager.close()
+
+    def _resolve_onnx_model_dir(self):
+        if os.path.isdir(self.model_name):
+            return os.path.join(self.model_name, "onnx")
+        return os.path.join("models", f"{self.model_name.replace('/', '__')}_onnx")
+
+    def _load_onnx_question_model(self):
+        if ORTModelForSeq2SeqLM is None:
+            raise RuntimeError("ONNX backend requires 'optimum[onnxruntime]'. Install it with: pip install optimum[onnxruntime]")
+
+        config_path = os.path.join(self.onnx_model_dir, "config.json")
+        if not os.path.isfile(config_path):
+            raise RuntimeError(
+                f"ONNX artifacts not found in {self.onnx_model_dir}. Run: python export_onnx.py"
+            )
 
-                    pair_key = (sentence.lower(), answer.lower())
-                    if pair_key in seen_pairs:
-                        continue
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            self.onnx_model_dir,
+            use_cache=True,
+            provider="CPUExecutionProvider",
+        )
 
-                    question = self._generate_question_for_answer(sentence, answer)
-                    if question:
-                        quality_score = self._score_question_candidate(question, answer, sentence)
-                        scored_entries.append(
-                            {
-                                "pair_key": pair_key,
-                                "question": question,
-                                "answer": answer,
-                                "sentence": sentence,
-                                "score": quality_score,
-                            }
-                        )
+    def export_onnx_model(self, output_dir=None):
+        if ORTModelForSeq2SeqLM is None:
+            raise RuntimeError("ONNX export requires 'optimum[onnxruntime]'. Install it with: pip install optimum[onnxruntime]")
+
+        output_dir = output_dir or self.onnx_model_dir
+        os.makedirs(output_dir, exist_ok=True)
+        onnx_model = ORTModelForSeq2SeqLM.from_pretrained(self.model_name, export=True, use_cache=True)
+        onnx_model.save_pretrained(output_dir)
+        self.tokenizer.save_pretrained(output_dir)
+        return output_dir
+
+    def _apply_int8_quantization(self, model):
+        if self.device.type != "cpu":
+            print(f"Int8 quantization is CPU-only; keeping float32 weights on {self.device}")
+            self.quantization_mode = "none"
+            self.model_fingerprint = f"{self._compute_model_fingerprint()}|{self.inference_backend}|none"
+            return model
+
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        print("✓ Applied int8 dynamic quantization to linear layers")
+        return model
+
+    def _compute_model_fingerprint(self):
+        if not os.path.isdir(self.model_name):
+            return f"hub:{self.model_name}"
+
+        digest = hashlib.sha256()
+        for child in sorted(os.listdir(self.model_name)):
+            full_path = os.path.join(self.model_name, child)
+            if not os.path.isfile(full_path):
+                continue
+
+            file_stat = os.stat(full_path)
+            digest.update(f"{child}:{file_stat.st_size}:{file_stat.st_mtime_ns}".encode("utf-8"))
+            if child.endswith(".json") and file_stat.st_size <= 1024 * 1024:
+                with open(full_path, "rb") as config_file:
+                    digest.update(config_file.read())
+
+        return f"dir:{digest.hexdigest()}"
+
+    def _resolve_decoding_profile(self, profile_name):
+        normalized_name = str(profile_name or "").strip().lower()
+        if not normalized_name:
+            return getattr(self, "default_decoding_profile", "quality")
+        if normalized_name not in self.decoding_profiles:
+            raise ValueError(f"Unknown decoding profile: {profile_name}")
+        return normalized_name
+
+    def _get_decoding_settings(self, profile_name, task):
+        return self.decoding_profiles[self._resolve_decoding_profile(profile_name)][task]
+
+    def get_generation_cache_stats(self):
+        if self.generation_cache is None:
+            return {}
+        return self.generation_cache.stats()
+
+    def get_translation_cache_stats(self):
+        if self.translation_cache is None:
+            return {}
+        return self.translation_cache.stats()
+
+    def generate_questions(
+        self,
+        text,
+        question_types,
+        quantities,
+        language="English",
+        use_story_compression=None,
+        decoding_profile=None,
+        progress_callback=None,
+        cancel_event=None,
+    ):
+        try:
+            return list(
+                self.iter_questions(
+                    text,
+                    question_types,
+                    quantities,
+                    language,
+                    use_story_compression=use_story_compression,
+                    decoding_profile=decoding_profile,
+                    progress_callback=progress_callback,
+                    cancel_event=cancel_event,
+                )
+            )
+        except GenerationCancelled:
+            raise
+        except Exception as error:
+            print(f"Error: {error}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    def iter_questions(
+        self,
+        text,
+        question_types,
+        quantities,
+        language="English",
+        use_story_compression=None,
+        decoding_profile=None,
+        progress_callback=None,
+        cancel_event=None,
+    ):
+        decoding_profile = self._resolve_decoding_profile(decoding_profile)
+        documents = [text] if isinstance(text, str) else list(text)
+        documents = [
+            self._normalize_text(document)
+            for document in documents
+            if document and next(self._iter_sentences(document), None) is not None
+        ]
+        compression_enabled = self.story_compression_enabled if use_story_compression is None else bool(use_story_compression)
+        is_filipino_mode = self._is_filipino_language(language)
+
+        document_requests = self._distribute_question_types(quantities, len(documents))
+        unassigned_count = sum(len(requested_types) for requested_types in document_requests)
+        window_total = sum(self._estimate_window_count(document) for document in documents)
+        target_count = sum(quantities.values())
+        produced_count = 0
+        carried_types = []
+        state = {"used_question_texts": set(), "used_tf_statements": set(), "tf_created": 0}
+        self.last_generation_stats = {"windows": 0, "documents": len(documents)}
+
+        with self.model_manager.use("question"):
+            for window_index, window_sentences, window_types in self._iter_document_windows(documents, document_requests):
+                unassigned_count -= len(window_types)
+                requested_types = carried_types + window_types
+                if not requested_types:
+                    continue
+                window_total = max(window_total, window_index + 1)
+                self.random.shuffle(requested_types)
+                self.sentence_analysis_cache.clear()
+
+                self._check_cancelled(cancel_event)
+                self._report_generation_progress(progress_callback, "window", window_index, window_total)
+                self.last_generation_stats["windows"] += 1
+                window_text = self._normalize_text(". ".join(window_sentences) + ".")
+                if compression_enabled:
+                    window_text = self._compress_story_for_qg(window_text)
+
+                sentences = self._split_sentences(window_text)
+                source_sentences = sentences
+                if is_filipino_mode:
+                    translated_sentences = self._translate_texts(
+                        sentences,
+                        "tl_en",
+                        decoding_profile,
+                        progress_callback=progress_callback,
+                        cancel_event=cancel_event,
+                    )
+                    aligned_pairs = [
+                        (translated_sentence, source_sentence)
+                        for translated_sentence, source_sentence in zip(translated_sentences, sentences)
+                        if len(translated_sentence) > 20
+                    ]
+                    if aligned_pairs:
+                        sentences = [translated_sentence for translated_sentence, _ in aligned_pairs]
+                        source_sentences = [source_sentence for _, source_sentence in aligned_pairs]
+
+                self._check_cancelled(cancel_event)
+                self._report_generation_progress(progress_callback, "extract", 0, len(sentences))
+                candidates = self._plan_question_candidates(sentences, source_sentences)
+                self._report_generation_progress(progress_callback, "extract", len(sentences), len(sentences))
+
+                question_stream = self._iter_accepted_questions(
+                    candidates,
+                    len(requested_types),
+                    decoding_profile,
+                    progress_callback=progress_callback,
+                    cancel_event=cancel_event,
+                    progress_offset=produced_count,
+                    progress_total=target_count,
+                )
+                window_items = self._assemble_question_items(question_stream, requested_types, state)
+                if is_filipino_mode:
+                    window_items = [
+                        self._translate_question_item_to_filipino(item, decoding_profile) for item in list(window_items)
+                    ]
+                for item in window_items:
+                    self._check_cancelled(cancel_event)
+                    produced_count += 1
+                    yield item
+
+                carried_types = requested_types
+                if not unassigned_count and not carried_types:
+                    break
+
+    def _iter_document_windows(self, documents, document_requests):
+        window_index = 0
+        for document, requested_types in zip(documents, document_requests):
+            document_length = max(1, len(document))
+            assigned_count = 0
+            windows = self._iter_sentence_windows(document)
+            current_window = next(windows, None)
+            while current_window is not None:
+                window_sentences, window_end = current_window
+                following_window = next(windows, None)
+                if following_window is None:
+                    cutoff = len(requested_types)
+                else:
+                    cutoff = min(len(requested_types), -(-window_end * len(requested_types) // document_length))
+                yield window_index, window_sentences, requested_types[assigned_count:cutoff]
+                assigned_count = max(assigned_count, cutoff)
+                window_index += 1
+                current_window = following_window
+
+    def _estimate_window_count(self, text):
+        return max(1, -(-len(text) // (self.window_token_budget * 4)))
+
+    def _count_tokens(self, text):
+        return len(self.tokenizer(text, add_special_tokens=False)["input_ids"])
+
+    def _iter_sentence_windows(self, text):
+        window_sentences = []
+        window_tokens = 0
+        window_end = 0
+        for sentence, sentence_end in self._iter_sentence_spans(text):
+            sentence_tokens = self._count_tokens(sentence)
+            if window_sentences and window_tokens + sentence_tokens > self.window_token_budget:
+                yield window_sentences, window_end
+                window_sentences = []
+                window_tokens = 0
+            window_sentences.append(sentence)
+            window_tokens += sentence_tokens
+            window_end = sentence_end
+
+        if window_sentences:
+            yield window_sentences, window_end
+
+    def _distribute_question_types(self, quantities, window_count):
+        window_requests = [[] for _ in range(window_count)]
+        if window_count == 0:
+            return window_requests
+
+        remaining = {
+            question_type: quantities.get(question_type, 0)
+            for question_type in ("multiple_choice", "true_or_false", "identification", "essay")
+        }
+        interleaved_types = []
+        while any(remaining.values()):
+            for question_type, count in remaining.items():
+                if count > 0:
+                    interleaved_types.append(question_type)
+                    remaining[question_type] = count - 1
+
+        total = len(interleaved_types)
+        for position, question_type in enumerate(interleaved_types):
+            window_requests[(position * window_count) // total].append(question_type)
+        return window_requests
+
+    def _is_filipino_language(self, language):
+        return self._normalize_text(language).lower() == "filipino"
+
+    def _check_cancelled(self, cancel_event):
+        if cancel_event is not None and cancel_event.is_set():
+            raise GenerationCancelled()
+
+    def _report_generation_progress(self, progress_callback, stage, completed, total):
+        if progress_callback is not None:
+            progress_callback(stage, int(completed), int(total))
+
+    def _plan_question_candidates(self, sentences, source_sentences=None):
+        if source_sentences is None:
+            source_sentences = sentences
+        candidates = []
+        seen_pairs = set()
 
-                if not scored_entries:
+        for sentence_index, sentence in enumerate(sentences):
+            if not self._is_sentence_informative(sentence):
+                continue
+
+            sentence_score = self._score_sentence_for_qg(sentence)
+            for answer_rank, answer in enumerate(self._extract_key_phrases(sentence)):
+                pair_key = (sentence.lower(), answer.lower())
+                if pair_key in seen_pairs:
                     continue
+                seen_pairs.add(pair_key)
+
+                candidates.append(
+                    {
+                        "sentence_index": sentence_index,
+                        "answer_rank": answer_rank,
+                        "sentence": sentence,
+                        "source_sentence": source_sentences[sentence_index],
+                        "answer": answer,
+                        "priority": sentence_score * 3 + self._score_answer_candidate(answer, sentence),
+                    }
+                )
 
-                scored_entries.sort(key=lambda item: item["score"], reverse=True)
-                max_from_sentence = min(3, target_count - len(questions_data))
+        candidates.sort(key=lambda item: (-item["priority"], item["sentence_index"], item["answer_rank"]))
+        return candidates
+
+    def _iter_accepted_questions(
+        self,
+        candidates,
+        target_count,
+        decoding_profile=None,
+        progress_callback=None,
+        cancel_event=None,
+        progress_offset=0,
+        progress_total=None,
+    ):
+        accepted_count = 0
+        per_sentence_counts = {}
+        progress_total = target_count if progress_total is None else progress_total
+        position = 0
+        dispatched = 0
+        decode_count_before = self.model_decode_count
 
-                for entry in scored_entries[:max_from_sentence]:
-                    if len(questions_data) >= target_count:
-                        break
-                    if entry["pair_key"] in seen_pairs:
+        try:
+            while position < len(candidates) and accepted_count < target_count:
+                self._check_cancelled(cancel_event)
+                self._report_generation_progress(progress_callback, "generate", progress_offset + accepted_count, progress_total)
+                remaining = target_count - accepted_count
+                wave_size = min(self.generation_batch_size, max(self.generation_wave_size, remaining))
+                wave = []
+                while position < len(candidates) and len(wave) < wave_size:
+                    candidate = candidates[position]
+                    position += 1
+                    if per_sentence_counts.get(candidate["sentence_index"], 0) >= self.max_questions_per_sentence:
                         continue
+                    wave.append(candidate)
 
-                    seen_pairs.add(entry["pair_key"])
-                    questions_data.append(
-                        {
-                            "question": entry["question"],
-                            "answer": entry["answer"],
-                            "sentence": entry["sentence"],
-                        }
-                    )
+                if not wave:
+                    break
 
-            if not questions_data:
-                return "Error: Could not generate questions from the text."
+                dispatched += len(wave)
+                questions = self._generate_questions_for_pairs(
+                    [(item["sentence"], item["answer"]) for item in wave],
+                    decoding_profile,
+                    cancel_event,
+                )
 
-            formatted_output = self._format_by_type(questions_data, quantities)
-            if is_filipino_mode:
-                formatted_output = self._translate_formatted_output_to_filipino(formatted_output)
-            return formatted_output
+                scored_entries = []
+                for candidate, question in zip(wave, questions):
+                    if not question:
+                        continue
+                    score = self._score_question_candidate(question, candidate["answer"], candidate["sentence"])
+                    scored_entries.append((score, candidate, question))
+                scored_entries.sort(key=lambda item: item[0], reverse=True)
 
-        except Exception as error:
-            print(f"Error: {error}")
-            import traceback
-            traceback.print_exc()
-            return f"Error: {str(error)}"
+                for _, candidate, question in scored_entries:
+                    if accepted_count >= target_count:
+                        break
+                    sentence_index = candidate["sentence_index"]
+                    if per_sentence_counts.get(sentence_index, 0) >= self.max_questions_per_sentence:
+                        continue
+                    per_sentence_counts[sentence_index] = per_sentence_counts.get(sentence_index, 0) + 1
+                    accepted_count += 1
+                    yield {
+                        "question": question,
+                        "answer": candidate["answer"],
+                        "sentence": candidate["sentence"],
+                        "source_sentence": candidate["source_sentence"],
+                    }
+
+            self._report_generation_progress(progress_callback, "generate", progress_offset + accepted_count, progress_total)
+        finally:
+            for key, value in (
+                ("candidates", len(candidates)),
+                ("dispatched", dispatched),
+                ("model_decodes", self.model_decode_count - decode_count_before),
+                ("accepted", accepted_count),
+            ):
+                self.last_generation_stats[key] = self.last_generation_stats.get(key, 0) + value
 
     def _split_sentences(self, text):
-        raw_sentences = re.split(r"[.!?]+", text)
-        cleaned_sentences = []
-        for raw_sentence in raw_sentences:
-            cleaned = self._normalize_text(raw_sentence)
+        return list(self._iter_sentences(text))
+
+    def _iter_sentences(self, text):
+        for sentence, _ in self._iter_sentence_spans(text):
+            yield sentence
+
+    def _iter_sentence_spans(self, text):
+        for match in re.finditer(r"[^.!?]+", text):
+            cleaned = self._normalize_text(match.group(0))
             if len(cleaned) > 20:
-                cleaned_sentences.append(cleaned)
-        return cleaned_sentences
+                yield cleaned, match.end()
 
     def _compress_story_for_qg(self, text, min_sentences=8, max_sentences=14):
         normalized_text = self._normalize_text(text)
@@ -248,14 +687,15 @@ class QuestionGenerator:
         if not cleaned_sentence:
             return 0.0
 
-        tokens = re.findall(r"[A-Za-z][A-Za-z'\-]*", cleaned_sentence)
+        analysis = self._analyze_sentence(cleaned_sentence)
+        tokens = analysis.words
         token_count = len(tokens)
         if token_count < 5:
             return 0.0
 
         unique_tokens = len({token.lower() for token in tokens})
-        proper_noun_count = len([token for token in tokens if token[:1].isupper()])
-        has_number = bool(re.search(r"\b\d+\b", cleaned_sentence))
+        proper_noun_count = sum(analysis.capitalized)
+        has_number = analysis.has_number
         has_connector = bool(re.search(r"\b(because|therefore|however|after|before|when|while|since|so)\b", cleaned_sentence, flags=re.IGNORECASE))
         has_quote = '"' in cleaned_sentence or "'" in cleaned_sentence
 
@@ -276,13 +716,14 @@ class QuestionGenerator:
         return score
 
     def _extract_key_phrases(self, sentence):
-        words = re.findall(r"[A-Za-z][A-Za-z'\-]*", sentence)
+        analysis = self._analyze_sentence(sentence)
+        words = analysis.words
         if not words:
             return []
 
-        time_phrases = self._extract_time_phrases(sentence)
-        stop_words = self._get_stop_words()
-        phrase_candidates = self._extract_phrase_candidates(sentence, stop_words)
+        time_phrases = analysis.time_phrases
+        stop_words = self.stop_words
+        phrase_candidates = analysis.phrase_candidates
 
         proper_nouns = []
         for index, word in enumerate(words):
@@ -290,7 +731,7 @@ class QuestionGenerator:
             if not cleaned_word:
                 continue
             is_probable_proper_noun = (
-                word[0].isupper()
+                analysis.capitalized[index]
                 and len(cleaned_word) > 2
                 and cleaned_word.lower() not in stop_words
             )
@@ -324,30 +765,82 @@ class QuestionGenerator:
         ranked = sorted(ordered_unique, key=lambda candidate: self._score_answer_candidate(candidate, sentence), reverse=True)
         return ranked[:5]
 
-    def _generate_question_for_answer(self, sentence, answer):
-        prompt = f"answer: {answer} context: {sentence} </s>"
+    def _generate_question_for_answer(self, sentence, answer, decoding_profile=None):
+        return self._generate_questions_for_pairs([(sentence, answer)], decoding_profile)[0]
+
+    def _generate_questions_for_pairs(self, pairs, decoding_profile=None, cancel_event=None):
+        if not pairs:
+            return []
+
+        decoding_settings = self._get_decoding_settings(decoding_profile, "question")
+        raw_questions = [None] * len(pairs)
+        cache_keys = [self._generation_cache_key(sentence, answer, decoding_settings) for sentence, answer in pairs]
+        if self.generation_cache is not None:
+            cached_questions = self.generation_cache.get_many(cache_keys)
+            for index, cache_key in enumerate(cache_keys):
+                raw_questions[index] = cached_questions.get(cache_key)
+
+        missing_indices = [index for index, raw_question in enumerate(raw_questions) if raw_question is None]
+        if missing_indices:
+            prompts = [self._build_question_prompt(*pairs[index]) for index in missing_indices]
+            decoded_questions = self._decode_prompts_in_batches(prompts, decoding_settings, cancel_event)
+            for index, decoded_question in zip(missing_indices, decoded_questions):
+                raw_questions[index] = decoded_question
+
+            if self.generation_cache is not None:
+                self.generation_cache.put_many(
+                    [(cache_keys[index], raw_questions[index]) for index in missing_indices]
+                )
 
-        encoded_inputs = self.tokenizer(
-            prompt,
-            return_tensors="pt",
-            max_length=256,
-            truncation=True,
+        return [
+            self._postprocess_generated_question(raw_question, sentence, answer)
+            for raw_question, (sentence, answer) in zip(raw_questions, pairs)
+        ]
+
+    def _generation_cache_key(self, sentence, answer, decoding_settings):
+        return CacheStore.make_key(
+            self.model_fingerprint,
+            decoding_settings,
+            self._normalize_text(sentence),
+            self._normalize_text(answer),
         )
-        input_ids = encoded_inputs["input_ids"].to(self.device)
-        attention_mask = encoded_inputs["attention_mask"].to(self.device)
-
-        with torch.no_grad():
-            outputs = self.model.generate(
-                input_ids=input_ids,
-                attention_mask=attention_mask,
-                max_length=96,
-                num_beams=4,
-                do_sample=False,
-                early_stopping=True,
-            )
 
-        question = self.tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
-        question = re.sub(r"^question:\s*", "", question, flags=re.IGNORECASE)
+    def _build_question_prompt(self, sentence, answer):
+        return f"answer: {answer} context: {sentence} </s>"
+
+    def _decode_prompts_in_batches(self, prompts, decoding_settings, cancel_event=None):
+        encoded_prompts = self.tokenizer(prompts, max_length=256, truncation=True)["input_ids"]
+        order = sorted(range(len(prompts)), key=lambda index: len(encoded_prompts[index]))
+        decoded = [""] * len(prompts)
+
+        with self.model_manager.use("question") as model:
+            for start in range(0, len(order), self.generation_batch_size):
+                self._check_cancelled(cancel_event)
+                batch_indices = order[start:start + self.generation_batch_size]
+                padded = self.tokenizer.pad(
+                    {"input_ids": [encoded_prompts[index] for index in batch_indices]},
+                    padding=True,
+                    return_tensors="pt",
+                )
+                input_ids = padded["input_ids"].to(self.device)
+                attention_mask = padded["attention_mask"].to(self.device)
+
+                with torch.no_grad():
+                    outputs = model.generate(
+                        input_ids=input_ids,
+                        attention_mask=attention_mask,
+                        **decoding_settings,
+                    )
+
+                self.model_decode_count += len(batch_indices)
+                batch_questions = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                for index, question in zip(batch_indices, batch_questions):
+                    decoded[index] = question.strip()
+
+        return decoded
+
+    def _postprocess_generated_question(self, raw_question, sentence, answer):
+        question = re.sub(r"^question:\s*", "", raw_question, flags=re.IGNORECASE)
         question = self._normalize_text(question)
         question = self._normalize_question_starter(question, sentence, answer)
 
@@ -365,100 +858,83 @@ class QuestionGenerator:
 
         return question
 
-    def _format_by_type(self, questions_data, quantities):
-        formatted = ""
-        q_num = 1
-        tf_created = 0
-        used_question_texts = set()
-        used_tf_statements = set()
-
-        question_pool = list(questions_data)
-        self.random.shuffle(question_pool)
-
-        requested_types = []
-        for question_type in ("multiple_choice", "true_or_false", "identification", "essay"):
-            requested_types.extend([question_type] * quantities.get(question_type, 0))
-        self.random.shuffle(requested_types)
-
-        for question_type in requested_types:
-            selected_index = None
-            selected_item = None
-            selected_statement = None
-            selected_tf_answer = None
-            selected_statement_key = None
-
-            for index, question_data in enumerate(question_pool):
-                normalized_question = question_data["question"].strip().lower()
-                if normalized_question in used_question_texts:
-                    continue
+    def _assemble_question_items(self, question_stream, requested_types, state):
+        question_pool = []
 
-                if question_type == "true_or_false":
-                    statement, tf_answer = self._build_true_false_item(question_data, tf_created)
-                    statement_key = self._normalize_text(statement).lower()
-                    if statement_key in used_tf_statements:
-                        continue
-
-                    selected_index = index
-                    selected_item = question_data
-                    selected_statement = statement
-                    selected_tf_answer = tf_answer
-                    selected_statement_key = statement_key
+        for question_data in question_stream:
+            question_pool.append(question_data)
+            while requested_types:
+                item = self._take_question_item(requested_types[0], question_pool, state)
+                if item is None:
                     break
+                requested_types.pop(0)
+                yield item
+            if not requested_types:
+                return
+
+        for question_type in list(requested_types):
+            item = self._take_question_item(question_type, question_pool, state)
+            if item is not None:
+                requested_types.remove(question_type)
+                yield item
+
+    def _take_question_item(self, question_type, question_pool, state):
+        selected_index = None
+        selected_item = None
+        selected_statement = None
+        selected_tf_answer = None
+        selected_statement_key = None
+
+        for index, question_data in enumerate(question_pool):
+            normalized_question = question_data["question"].strip().lower()
+            if normalized_question in state["used_question_texts"]:
+                continue
 
-                selected_index = index
-                selected_item = question_data
-                break
+            if question_type == "true_or_false":
+                statement, tf_answer = self._build_true_false_item(question_data, state["tf_created"])
+                statement_key = self._normalize_text(statement).lower()
+                if statement_key in state["used_tf_statements"]:
+                    continue
 
-            if selected_item is None:
-                continue
+                selected_statement = statement
+                selected_tf_answer = tf_answer
+                selected_statement_key = statement_key
 
-            question_pool.pop(selected_index)
+            selected_index = index
+            selected_item = question_data
+            break
 
-            normalized_question = selected_item["question"].strip().lower()
-            used_question_texts.add(normalized_question)
+        if selected_item is None:
+            return None
 
-            if question_type == "multiple_choice":
-                options, answer_label = self._build_multiple_choice_options(selected_item)
-                if not options or not answer_label:
-                    formatted += f"{q_num}. {selected_item['question']}\n"
-                    formatted += f"Answer: {selected_item['answer']}\n"
-                    formatted += f"Context: {self._format_context(selected_item['sentence'])}\n\n"
-                    q_num += 1
-                    continue
-                formatted += f"{q_num}. {selected_item['question']}\n"
-                formatted += f"A) {options[0]}\n"
-                formatted += f"B) {options[1]}\n"
-                formatted += f"C) {options[2]}\n"
-                formatted += f"D) {options[3]}\n"
-                formatted += f"Answer: {answer_label}\n"
-                formatted += f"Context: {self._format_context(selected_item['sentence'])}\n\n"
-                q_num += 1
-                continue
+        question_pool.pop(selected_index)
+        state["used_question_texts"].add(selected_item["question"].strip().lower())
+        context = self._format_context(selected_item.get("source_sentence") or selected_item["sentence"])
+
+        if question_type == "multiple_choice":
+            options, answer_label = self._build_multiple_choice_options(selected_item)
+            if not options or not answer_label:
+                return QuestionItem("identification", selected_item["question"], (), selected_item["answer"], context)
+            return QuestionItem(
+                "multiple_choice",
+                selected_item["question"],
+                [f"{label}) {option}" for label, option in zip(("A", "B", "C", "D"), options)],
+                answer_label,
+                context,
+            )
 
-            if question_type == "true_or_false":
-                used_tf_statements.add(selected_statement_key)
-                formatted += f"{q_num}. {selected_statement}\n"
-                formatted += f"Answer: {selected_tf_answer}\n"
-                formatted += f"Context: {self._format_context(selected_item['sentence'])}\n\n"
-                q_num += 1
-                tf_created += 1
-                continue
+        if question_type == "true_or_false":
+            state["used_tf_statements"].add(selected_statement_key)
+            state["tf_created"] += 1
+            return QuestionItem("true_or_false", selected_statement, (), selected_tf_answer, context)
 
-            if question_type == "identification":
-                formatted += f"{q_num}. {selected_item['question']}\n"
-                formatted += f"Answer: {selected_item['answer']}\n"
-                formatted += f"Context: {self._format_context(selected_item['sentence'])}\n\n"
-                q_num += 1
-                continue
+        if question_type == "identification":
+            return QuestionItem("identification", selected_item["question"], (), selected_item["answer"], context)
 
-            if question_type == "essay":
-                essay_prompt = self._build_essay_prompt(selected_item)
-                formatted += f"{q_num}. {essay_prompt}\n"
-                formatted += "Note: Manual checking required.\n"
-                formatted += "\n"
-                q_num += 1
+        return QuestionItem("essay", self._build_essay_prompt(selected_item))
 
-        return formatted
+    def render_question_items(self, items, language="English"):
+        return render_question_items(items, language)
 
     def _build_essay_prompt(self, question_data):
         original_question = self._normalize_text(question_data.get("question", ""))
@@ -482,150 +958,202 @@ class QuestionGenerator:
         return "Write a 3-5 sentence explanation using details from the story."
 
     def _ensure_translation_resources(self, direction):
-        if direction in self.translation_resources:
-            return self.translation_resources[direction]
+        return self.model_manager.get(f"translation:{direction}")
 
+    def _load_translation_resources(self, direction):
         model_name = self.translation_model_names[direction]
         tokenizer = AutoTokenizer.from_pretrained(model_name)
         model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
         model.to(self.device)
-        self.translation_resources[direction] = (tokenizer, model)
+        model.eval()
         return tokenizer, model
 
-    def _translate_text(self, text, direction):
-        cleaned_text = self._normalize_text(text)
-        if not cleaned_text:
-            return ""
+    def prefetch_translation_models(self):
+        for direction in self.translation_model_names:
+            self._ensure_translation_resources(direction)
 
-        cache_key = (direction, cleaned_text)
-        cached_value = self.translation_cache.get(cache_key)
-        if cached_value is not None:
-            return cached_value
+    def _translate_text(self, text, direction, decoding_profile=None):
+        return self._translate_texts([text], direction, decoding_profile)[0]
 
-        try:
-            tokenizer, model = self._ensure_translation_resources(direction)
-            encoded = tokenizer(
-                cleaned_text,
-                return_tensors="pt",
-                max_length=512,
-                truncation=True,
-            )
-            input_ids = encoded["input_ids"].to(self.device)
-            attention_mask = encoded["attention_mask"].to(self.device)
-
-            with torch.no_grad():
-                generated = model.generate(
-                    input_ids=input_ids,
-                    attention_mask=attention_mask,
-                    max_length=256,
-                    num_beams=4,
-                    do_sample=False,
-                    early_stopping=True,
-                )
+    def _translate_texts(self, texts, direction, decoding_profile=None, progress_callback=None, cancel_event=None):
+        decoding_profile = self._resolve_decoding_profile(decoding_profile)
+        cleaned_texts = [self._normalize_text(text) for text in texts]
+        unique_texts = [cleaned_text for cleaned_text in dict.fromkeys(cleaned_texts) if cleaned_text]
 
-            translated = tokenizer.decode(generated[0], skip_special_tokens=True).strip()
-            normalized_translated = self._normalize_text(translated)
-            self.translation_cache[cache_key] = normalized_translated
-            return normalized_translated
+        translations = {"": ""}
+        translations.update(self.glossary.lookup_many(direction, unique_texts))
+        cache_keys = {
+            text: self._translation_cache_key(direction, decoding_profile, text)
+            for text in unique_texts
+            if text not in translations
+        }
+        if self.translation_cache is not None and cache_keys:
+            cached_values = self.translation_cache.get_many(cache_keys.values())
+            for text, cache_key in cache_keys.items():
+                if cache_key in cached_values:
+                    translations[text] = cached_values[cache_key]
+
+        pending_texts = [text for text in unique_texts if text not in translations]
+        if pending_texts:
+            decoded_texts = self._decode_translations_in_batches(
+                pending_texts,
+                direction,
+                decoding_profile,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+            )
+            memory_entries = []
+            for text, decoded_text in zip(pending_texts, decoded_texts):
+                if not decoded_text:
+                    translations[text] = text
+                    continue
+                translations[text] = decoded_text
+                memory_entries.append((cache_keys[text], decoded_text))
+            if self.translation_cache is not None:
+                self.translation_cache.put_many(memory_entries)
+
+        return [translations[cleaned_text] for cleaned_text in cleaned_texts]
+
+    def _translation_cache_key(self, direction, decoding_profile, text):
+        return CacheStore.make_key(direction, self.translation_model_names[direction], decoding_profile, text)
+
+    def _decode_translations_in_batches(
+        self,
+        texts,
+        direction,
+        decoding_profile,
+        progress_callback=None,
+        cancel_event=None,
+    ):
+        translated_texts = [None] * len(texts)
+        try:
+            self._ensure_translation_resources(direction)
         except Exception as error:
             print(f"Translation warning ({direction}): {error}")
-            self.translation_cache[cache_key] = cleaned_text
-            return cleaned_text
-
-    def _split_translation_chunks(self, text, max_chars=260):
-        segments = [segment.strip() for segment in re.split(r"(?<=[.!?])\s+", text) if segment.strip()]
-        if not segments:
-            return [text] if text else []
-
-        chunks = []
-        current_chunk = ""
-
-        for segment in segments:
-            proposed = f"{current_chunk} {segment}".strip() if current_chunk else segment
-            if len(proposed) <= max_chars:
-                current_chunk = proposed
-                continue
-
-            if current_chunk:
-                chunks.append(current_chunk)
-            current_chunk = segment
-
-        if current_chunk:
-            chunks.append(current_chunk)
-
-        return chunks
+            return translated_texts
+
+        decoding_settings = self._get_decoding_settings(decoding_profile, "translation")
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        with self.model_manager.use(f"translation:{direction}") as (tokenizer, model):
+            for start in range(0, len(order), self.translation_batch_size):
+                self._check_cancelled(cancel_event)
+                self._report_generation_progress(progress_callback, "translate", start, len(order))
+                batch_indices = order[start:start + self.translation_batch_size]
+                batch_texts = [texts[index] for index in batch_indices]
+                try:
+                    encoded = tokenizer(
+                        batch_texts,
+                        return_tensors="pt",
+                        max_length=512,
+                        truncation=True,
+                        padding=True,
+                    )
+                    input_ids = encoded["input_ids"].to(self.device)
+                    attention_mask = encoded["attention_mask"].to(self.device)
+
+                    with torch.no_grad():
+                        generated = model.generate(
+                            input_ids=input_ids,
+                            attention_mask=attention_mask,
+                            **decoding_settings,
+                        )
+                    decoded_batch = tokenizer.batch_decode(generated, skip_special_tokens=True)
+                except Exception as error:
+                    print(f"Translation warning ({direction}): {error}")
+                    continue
 
-    def _translate_long_text(self, text, direction):
-        normalized_text = self._normalize_text(text)
-        if not normalized_text:
-            return ""
+                for index, translated_text in zip(batch_indices, decoded_batch):
+                    translated_texts[index] = self._normalize_text(translated_text)
 
-        chunks = self._split_translation_chunks(normalized_text)
-        translated_chunks = [self._translate_text(chunk, direction) for chunk in chunks]
-        translated_chunks = [chunk for chunk in translated_chunks if chunk]
-        translated_text = self._normalize_text(" ".join(translated_chunks))
-        if direction == "en_tl":
-            return self._normalize_filipino_spelling(translated_text)
-        return translated_text
-
-    def _translate_formatted_output_to_filipino(self, formatted_output):
-        if not formatted_output.strip():
-            return formatted_output
-
-        translated_lines = []
-        for line in formatted_output.splitlines():
-            stripped_line = line.strip()
-            if not stripped_line:
-                translated_lines.append("")
-                continue
+        self._report_generation_progress(progress_callback, "translate", len(order), len(order))
+        return translated_texts
 
-            question_match = re.match(r"^(\d+\.\s+)(.+)$", stripped_line)
-            if question_match:
-                translated_question = self._translate_text(question_match.group(2), "en_tl")
-                translated_question = self._normalize_filipino_spelling(translated_question)
-                translated_lines.append(f"{question_match.group(1)}{translated_question}")
-                continue
+    def _translate_question_item_to_filipino(self, item, decoding_profile=None):
+        source_texts = [item.question]
 
-            choice_match = re.match(r"^([A-D]\)\s+)(.+)$", stripped_line)
+        choice_prefixes = []
+        choice_starters = []
+        for choice in item.choices:
+            choice_match = re.match(r"^([A-D]\)\s+)(.+)$", choice)
             if choice_match:
-                translated_choice = self._translate_text(choice_match.group(2), "en_tl")
-                translated_choice = self._normalize_filipino_spelling(translated_choice)
-                translated_lines.append(f"{choice_match.group(1)}{translated_choice}")
-                continue
-
-            if stripped_line.startswith("Context:"):
-                context_value = stripped_line.split(":", 1)[1].strip()
-                translated_context = self._translate_text(context_value, "en_tl")
-                translated_context = self._normalize_filipino_spelling(translated_context)
-                translated_lines.append(f"Context: {translated_context}")
-                continue
-
-            if stripped_line.startswith("Answer:"):
-                answer_value = stripped_line.split(":", 1)[1].strip()
-                answer_upper = answer_value.upper()
-                answer_lower = answer_value.lower()
-
-                if len(answer_upper) == 1 and answer_upper in {"A", "B", "C", "D"}:
-                    translated_lines.append(f"Answer: {answer_upper}")
-                    continue
+                choice_prefixes.append(choice_match.group(1))
+                choice_body = choice_match.group(2)
+            else:
+                choice_prefixes.append("")
+                choice_body = choice
+            starter, option_text = self._split_option_sentence(choice_body)
+            choice_starters.append(starter)
+            source_texts.append(option_text)
+
+        answer_value = self._normalize_text(item.answer)
+        translate_answer = bool(answer_value) and not (
+            (len(answer_value) == 1 and answer_value.upper() in {"A", "B", "C", "D"})
+            or answer_value.lower() in {"true", "false"}
+        )
+        if translate_answer:
+            source_texts.append(answer_value)
+
+        translated_texts = iter(self._translate_texts_to_filipino(source_texts, decoding_profile))
+        translated_question = next(translated_texts)
+        translated_bodies = []
+        translated_options = []
+        for starter in choice_starters:
+            translated_body = next(translated_texts)
+            translated_options.append(translated_body)
+            if starter:
+                translated_body = self.filipino_option_sentence_templates[starter].format(translated_body.rstrip(".!?"))
+            translated_bodies.append(translated_body)
+
+        if translate_answer:
+            translated_answer = next(translated_texts)
+        elif len(answer_value) == 1:
+            translated_answer = answer_value.upper()
+        else:
+            translated_answer = answer_value.title()
+
+        if all(choice_prefixes):
+            answer_index = "ABCD".find(translated_answer) if len(translated_answer) == 1 else -1
+            translated_bodies, translated_answer = self._drop_duplicate_choices(translated_bodies, translated_answer)
+            if item.question_type == "multiple_choice" and len(translated_bodies) < 3 and 0 <= answer_index < len(translated_options):
+                return item.replace(
+                    question_type="identification",
+                    question=translated_question,
+                    choices=(),
+                    answer=translated_options[answer_index],
+                )
+            choice_prefixes = [f"{label}) " for label in "ABCD"[:len(translated_bodies)]]
+        translated_choices = [f"{prefix}{body}" for prefix, body in zip(choice_prefixes, translated_bodies)]
 
-                if answer_lower in {"true", "false"}:
-                    translated_lines.append(f"Answer: {answer_value.title()}")
-                    continue
+        return item.replace(
+            question=translated_question,
+            choices=translated_choices,
+            answer=translated_answer,
+        )
 
-                translated_answer = self._translate_text(answer_value, "en_tl")
-                translated_answer = self._normalize_filipino_spelling(translated_answer)
-                translated_lines.append(f"Answer: {translated_answer}")
-                continue
+    def _drop_duplicate_choices(self, choices, answer_label):
+        answer_index = "ABCD".find(answer_label) if len(answer_label) == 1 else -1
+        if answer_index < 0 or answer_index >= len(choices):
+            return choices, answer_label
 
-            if stripped_line.lower() == "note: manual checking required.":
-                translated_lines.append("Note: Kailangan ng manwal na pag-check.")
+        answer_key = choices[answer_index].casefold()
+        seen = set()
+        kept_choices = []
+        new_answer_label = answer_label
+        for index, choice in enumerate(choices):
+            choice_key = choice.casefold()
+            if index != answer_index and (choice_key == answer_key or choice_key in seen):
                 continue
-
-            translated_line = self._translate_text(stripped_line, "en_tl")
-            translated_lines.append(self._normalize_filipino_spelling(translated_line))
-
-        return "\n".join(translated_lines)
+            seen.add(choice_key)
+            if index == answer_index:
+                new_answer_label = "ABCD"[len(kept_choices)]
+            kept_choices.append(choice)
+        return kept_choices, new_answer_label
+
+    def _translate_texts_to_filipino(self, texts, decoding_profile=None):
+        return [
+            self._normalize_filipino_spelling(translated_text)
+            for translated_text in self._translate_texts(texts, "en_tl", decoding_profile)
+        ]
 
     def _normalize_filipino_spelling(self, text):
         normalized_text = self._normalize_text(text)
@@ -808,12 +1336,6 @@ class QuestionGenerator:
         return True
 
     def _count_meaningful_token_changes(self, original, candidate):
-        stop_words = {
-            "the", "a", "an", "is", "are", "was", "were", "be", "been", "and", "or", "but", "in", "on", "at",
-            "to", "for", "of", "with", "by", "from", "it", "that", "this", "which", "who", "there", "their",
-            "as", "into", "onto", "up", "down", "out", "about",
-        }
-
         original_tokens = re.findall(r"[A-Za-z0-9']+", original.lower())
         candidate_tokens = re.findall(r"[A-Za-z0-9']+", candidate.lower())
         matcher = difflib.SequenceMatcher(a=original_tokens, b=candidate_tokens)
@@ -825,13 +1347,16 @@ class QuestionGenerator:
             changed_tokens.extend(original_tokens[i1:i2])
             changed_tokens.extend(candidate_tokens[j1:j2])
 
-        meaningful_changes = [token for token in changed_tokens if token not in stop_words and len(token) > 2]
+        meaningful_changes = [
+            token for token in changed_tokens if not self.lexicon.has(token, CORE_STOP_WORD) and len(token) > 2
+        ]
         return len(set(meaningful_changes))
 
     def _get_distractors(self, sentence, correct_answer, count=3):
-        stop_words = self._get_stop_words()
-        phrase_candidates = self._extract_phrase_candidates(sentence, stop_words)
-        words = re.findall(r"[A-Za-z][A-Za-z'\-]*", sentence)
+        analysis = self._analyze_sentence(sentence)
+        stop_words = self.stop_words
+        phrase_candidates = analysis.phrase_candidates
+        words = analysis.words
 
         candidates = []
         for phrase in phrase_candidates:
@@ -866,7 +1391,8 @@ class QuestionGenerator:
             correct_answer = self._clean_token(question_data["answer"])
         correct_token_count = self._token_count(correct_answer)
 
-        correct_category = self._infer_entity_category(correct_answer)
+        analysis = self._analyze_sentence(question_data["sentence"])
+        correct_category = self._get_answer_category(correct_answer, analysis)
         semantic_distractors = self._get_semantic_distractors(correct_answer, 4)
         context_distractors = self._get_distractors(question_data["sentence"], correct_answer, 12)
         distractors = semantic_distractors + context_distractors
@@ -883,7 +1409,7 @@ class QuestionGenerator:
             if correct_token_count >= 2 and self._token_count(cleaned) < 2:
                 continue
 
-            if self._is_same_category(correct_category, self._infer_entity_category(cleaned)):
+            if self._is_same_category(correct_category, self._get_answer_category(cleaned, analysis)):
                 same_category_distractors.append(cleaned)
             else:
                 other_distractors.append(cleaned)
@@ -1035,8 +1561,9 @@ class QuestionGenerator:
         return self._normalize_text(body)
 
     def _infer_preferred_question_starter(self, sentence, answer):
-        category = self._infer_entity_category(answer)
-        lowered_sentence = sentence.lower()
+        analysis = self._analyze_sentence(sentence)
+        category = self._get_answer_category(answer, analysis)
+        lowered_sentence = analysis.lowered
 
         if category == "person":
             return "who"
@@ -1066,13 +1593,15 @@ class QuestionGenerator:
         if first_char.isalpha():
             option = first_char.lower() + option[1:]
 
-        if starter == "why":
-            return f"It happened because {option}."
-        if starter == "how":
-            return f"It happened through {option}."
-        if starter == "which":
-            return f"The best choice is {option}."
-        return f"It was {option}."
+        template = self.option_sentence_templates.get(starter, self.option_sentence_templates["what"])
+        return template.format(option)
+
+    def _split_option_sentence(self, option_text):
+        for starter, template in self.option_sentence_templates.items():
+            prefix, suffix = template.split("{}")
+            if option_text.startswith(prefix) and option_text.endswith(suffix) and len(option_text) > len(template) - 2:
+                return starter, option_text[len(prefix):len(option_text) - len(suffix)]
+        return "", option_text
 
     def _is_quantity_answer(self, answer_text):
         cleaned = self._clean_phrase(answer_text).lower()
@@ -1147,50 +1676,37 @@ class QuestionGenerator:
         if re.fullmatch(r"\d+", lowered):
             return False
 
-        tokens = re.findall(r"[A-Za-z0-9']+", lowered)
-        if not tokens:
-            return False
-
-        if len(tokens) == 1 and len(tokens[0]) <= 2:
-            return False
-
-        if len(tokens) == 1 and (
-            tokens[0] in self.weak_answer_words
-            or tokens[0] in self.filipino_function_words
-            or tokens[0] in self.low_value_answer_words
-        ):
-            return False
-
-        if len(tokens) == 1 and (tokens[0].endswith("'s") or tokens[0].endswith("’s")):
+        token_flags = self.lexicon.classify(lowered)
+        if not token_flags:
             return False
 
-        stop_words = self._get_stop_words()
-        meaningful_tokens = [
-            token
-            for token in tokens
-            if token not in stop_words and token not in self.weak_answer_words and token not in self.low_value_answer_words
-        ]
-        if not meaningful_tokens:
-            return False
+        if len(token_flags) == 1:
+            token, flags = token_flags[0]
+            if len(token) <= 2:
+                return False
+            if flags & (WEAK_ANSWER | FILIPINO_FUNCTION | LOW_VALUE_ANSWER):
+                return False
+            if token.endswith("'s") or token.endswith("’s"):
+                return False
 
-        return True
+        return any(not flags & UNINFORMATIVE for _, flags in token_flags)
 
     def _infer_answer_type(self, answer):
         lowered = answer.lower().strip()
 
-        if lowered in self.semantic_pools["time_of_day"]:
+        if self.lexicon.in_pool("time_of_day", lowered):
             return "time_of_day"
 
         if any(token in lowered for token in ["minute", "hour", "day", "week", "ago"]):
             return "duration"
 
-        if lowered in self.semantic_pools["frequency"]:
+        if self.lexicon.in_pool("frequency", lowered):
             return "frequency"
 
-        if lowered in self.semantic_pools["number"] or re.fullmatch(r"\d+", lowered):
+        if self.lexicon.in_pool("number", lowered) or re.fullmatch(r"\d+", lowered):
             return "number"
 
-        if lowered in self.semantic_pools["direction"]:
+        if self.lexicon.in_pool("direction", lowered):
             return "direction"
 
         return "generic_noun"
@@ -1212,24 +1728,20 @@ class QuestionGenerator:
         if self._is_action_phrase(cleaned):
             return "action"
 
-        person_markers = {"don", "dona", "doña", "mr", "mrs", "ms", "sir", "lady", "prince", "princess", "haring", "reyna"}
-        place_markers = {"kingdom", "kaharian", "city", "lungsod", "village", "nayon", "forest", "gubat", "mountain", "bundok", "river", "ilog", "palace", "palasyo", "island", "pulo"}
-        creature_markers = {"bird", "ibon", "dragon", "horse", "kabayo", "wolf", "lobo", "lion", "leon", "snake", "ahas", "adarna"}
-        title_markers = {"story", "kuwento", "alamat", "epiko", "awit", "book", "novel", "poem"}
-
-        if any(token in person_markers for token in re.findall(r"[A-Za-z']+", lowered)):
+        marker_flags = self.lexicon.combined_flags(lowered, WORD_PATTERN)
+        if marker_flags & PERSON_MARKER:
             return "person"
 
         if len(tokens) >= 2 and all(token and token[0].isupper() for token in cleaned.split() if token):
             return "person"
 
-        if any(token in place_markers for token in re.findall(r"[A-Za-z']+", lowered)):
+        if marker_flags & PLACE_MARKER:
             return "place"
 
-        if any(token in creature_markers for token in re.findall(r"[A-Za-z']+", lowered)):
+        if marker_flags & CREATURE_MARKER:
             return "creature"
 
-        if any(token in title_markers for token in re.findall(r"[A-Za-z']+", lowered)):
+        if marker_flags & TITLE_MARKER:
             return "title"
 
         if len(tokens) >= 2 and any(token and token[0].isupper() for token in cleaned.split()):
@@ -1289,11 +1801,10 @@ class QuestionGenerator:
         if len(tokens) < 2:
             return False
 
-        title_markers = {"story", "tale", "legend", "book", "chapter", "article", "passage", "kuwento", "alamat", "epiko"}
-        if tokens[0] in title_markers:
+        if self.lexicon.has(tokens[0], PASSAGE_MARKER):
             second_token = tokens[1]
             if (
-                second_token in self.common_verb_tokens
+                self.lexicon.has(second_token, COMMON_VERB)
                 or second_token.endswith("ed")
                 or second_token.endswith("ing")
             ):
@@ -1302,7 +1813,7 @@ class QuestionGenerator:
         if self._is_action_phrase(cleaned):
             return False
 
-        return tokens[-1] in self.common_verb_tokens
+        return self.lexicon.has(tokens[-1], COMMON_VERB)
 
     def _is_mostly_stop_words(self, text, stop_words):
         tokens = re.findall(r"[A-Za-z0-9']+", text.lower())
@@ -1346,31 +1857,39 @@ class QuestionGenerator:
         return cleaned
 
     def _get_stop_words(self):
-        english_stop_words = {
-            "is", "are", "was", "were", "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "be", "been", "have", "has", "had", "do", "does", "did", "will",
-            "would", "could", "should", "may", "might", "must", "can", "it", "that", "this", "which", "who",
-            "what", "when", "where", "why", "how", "there", "their", "then", "than", "very", "just", "while",
-            "after", "before", "during", "since", "until", "every", "as", "into", "onto", "up", "down", "out",
-            "about"
-        }
-        return english_stop_words.union(self.filipino_function_words)
+        return self.stop_words
+
+    def _analyze_sentence(self, sentence):
+        analysis = self.sentence_analysis_cache.get(sentence)
+        if analysis is not None:
+            return analysis
+
+        analysis = SentenceAnalysis(sentence, self.lexicon)
+        analysis.phrase_candidates = self._extract_phrase_candidates(sentence, self.stop_words)
+        analysis.time_phrases = self._extract_time_phrases(sentence)
+        if len(self.sentence_analysis_cache) >= 4096:
+            self.sentence_analysis_cache.clear()
+        self.sentence_analysis_cache[sentence] = analysis
+        return analysis
+
+    def _get_answer_category(self, answer, analysis):
+        category = analysis.entity_categories.get(answer)
+        if category is None:
+            category = self._infer_entity_category(answer)
+            analysis.entity_categories[answer] = category
+        return category
 
     def _is_sentence_informative(self, sentence):
-        stop_words = self._get_stop_words()
-        tokens = [token for token in re.findall(r"[A-Za-z0-9']+", sentence.lower()) if token not in stop_words]
-        meaningful_tokens = [
-            token for token in tokens if token not in self.weak_answer_words and token not in self.low_value_answer_words
-        ]
+        analysis = self._analyze_sentence(sentence)
+        meaningful_tokens = [token for token, flags in analysis.token_flags if not flags & UNINFORMATIVE]
 
         if len(meaningful_tokens) < 5:
             return False
 
-        phrase_candidates = self._extract_phrase_candidates(sentence, stop_words)
-        if phrase_candidates:
+        if analysis.phrase_candidates:
             return True
 
-        if re.search(r"\b\d+\b", sentence):
+        if analysis.has_number:
             return True
 
         return len(meaningful_tokens) >= 7
@@ -1391,7 +1910,8 @@ class QuestionGenerator:
         if any(token and token[0].isupper() for token in cleaned.split()):
             score += 2
 
-        entity_category = self._infer_entity_category(cleaned)
+        analysis = self._analyze_sentence(sentence)
+        entity_category = self._get_answer_category(cleaned, analysis)
         if entity_category in {"person", "place", "creature", "title"}:
             score += 3
         if entity_category == "action":
@@ -1403,7 +1923,7 @@ class QuestionGenerator:
         if len(tokens) == 1 and tokens[0] in self.weak_answer_words:
             score -= 6
 
-        if lowered in sentence.lower():
+        if lowered in analysis.lowered:
             score += 1
 
         return score
@@ -2,7 +2,6 @@ import os
 import sys
 from typing import Dict, List
 
-from extract_text import ExtractText
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -22,14 +21,19 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QCheckBox,
+    QComboBox,
     QMenu,
 )
 
+from workers import DocumentExtractionWorker
+
 
 class QuestionSetting(QWidget):
     generate_requested = Signal(dict)
     save_notebook_requested = Signal(dict)
     view_generated_requested = Signal()
+    cancel_generation_requested = Signal()
+    language_changed = Signal(str)
 
     def __init__(self):
         super().__init__()
@@ -37,6 +41,8 @@ class QuestionSetting(QWidget):
 
         self.question_button = QuestionButton()
         self.input_area = InputArea()
+        self.input_area.extraction_completed.connect(self._on_input_extracted)
+        self.pending_generate_payload = None
 
         question_group = QGroupBox()
         question_group.setStyleSheet("border:0;")
@@ -94,6 +100,23 @@ class QuestionSetting(QWidget):
         language_vlayout.addWidget(self.filipino)
         language_group.setLayout(language_vlayout)
 
+        decoding_group = QGroupBox()
+        decoding_group.setStyleSheet("border:0;")
+        decoding_label = QLabel("Generation Mode")
+        decoding_label.setStyleSheet("font-size:16px;")
+        self.decoding_profile = QComboBox()
+        self.decoding_profile.addItem("Quality (slowest)", "quality")
+        self.decoding_profile.addItem("Balanced", "balanced")
+        self.decoding_profile.addItem("Fast drafts", "fast")
+        self.decoding_profile.setStyleSheet("font-size:14px;")
+        self._set_decoding_profile("quality")
+
+        decoding_vlayout = QVBoxLayout()
+        decoding_vlayout.addWidget(decoding_label)
+        decoding_vlayout.addWidget(self.decoding_profile)
+        decoding_vlayout.addStretch()
+        decoding_group.setLayout(decoding_vlayout)
+
         status_group = QGroupBox()
         status_group.setStyleSheet("border:0;")
         status_label = QLabel("Notebook Status")
@@ -102,15 +125,19 @@ class QuestionSetting(QWidget):
         self.status_notebook_label.setStyleSheet("font-size:14px;")
         self.status_set_count_label = QLabel("Sets: 1 set")
         self.status_set_count_label.setStyleSheet("font-size:14px; font-weight:600;")
+        self.status_model_label = QLabel("Model: Loading...")
+        self.status_model_label.setStyleSheet("font-size:12px; color: #777;")
 
         status_vlayout = QVBoxLayout()
         status_vlayout.addWidget(status_label)
         status_vlayout.addWidget(self.status_notebook_label)
         status_vlayout.addWidget(self.status_set_count_label)
+        status_vlayout.addWidget(self.status_model_label)
         status_group.setLayout(status_vlayout)
 
         question_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         language_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        decoding_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         status_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         content_layout = QVBoxLayout()
@@ -118,6 +145,7 @@ class QuestionSetting(QWidget):
         filter_layout.addWidget(question_group)
         filter_layout.addLayout(qty_layout)
         filter_layout.addWidget(language_group)
+        filter_layout.addWidget(decoding_group)
         filter_layout.addWidget(status_group)
 
         content_layout.addWidget(self.input_area)
@@ -127,6 +155,7 @@ class QuestionSetting(QWidget):
 
         self.question_button.generate_question_button.clicked.connect(self._on_generate_clicked)
         self.question_button.view_generated_button.clicked.connect(self.view_generated_requested.emit)
+        self.question_button.cancel_button.clicked.connect(self.cancel_generation_requested.emit)
 
     def request_save(self):
         self._on_save_clicked()
@@ -138,8 +167,9 @@ class QuestionSetting(QWidget):
         return {
             "file_input": self.input_area.textbox.text().strip(),
             "text_input": self.input_area.input_message.toPlainText().strip(),
-            "input_content": self.input_area.get_input_content(),
-            "input_error": self.input_area.last_input_error,
+            "input_content": self.input_area.input_message.toPlainText().strip(),
+            "input_documents": [],
+            "input_error": "",
             "multiple_choice_bool": self.multiple_choice.isChecked(),
             "true_or_false_bool": self.true_or_false.isChecked(),
             "identification_bool": self.identification.isChecked(),
@@ -149,6 +179,7 @@ class QuestionSetting(QWidget):
             "identification_qty": self.identification_spinbox.value(),
             "essay_qty": self.essay_spinbox.value(),
             "language": self.language_chosen,
+            "decoding_profile": self.decoding_profile.currentData(),
         }
 
     def set_from_saved_settings(self, settings: Dict):
@@ -169,6 +200,10 @@ class QuestionSetting(QWidget):
         self.filipino.setChecked(language == "Filipino")
         self.language_chosen = language
 
+        decoding_profile = settings.get("decoding_profile")
+        if decoding_profile:
+            self._set_decoding_profile(decoding_profile)
+
     def reset_to_defaults(self):
         self.input_area.reset_inputs()
 
@@ -189,6 +224,12 @@ class QuestionSetting(QWidget):
         self.english.setAutoExclusive(True)
         self.filipino.setAutoExclusive(True)
         self.language_chosen = ""
+        self._set_decoding_profile("quality")
+
+    def _set_decoding_profile(self, profile_name: str):
+        index = self.decoding_profile.findData(profile_name)
+        if index >= 0:
+            self.decoding_profile.setCurrentIndex(index)
 
     def update_notebook_status(self, notebook_name: str, set_count: int):
         display_name = notebook_name.strip() if notebook_name else "New Notebook"
@@ -197,6 +238,15 @@ class QuestionSetting(QWidget):
         self.status_notebook_label.setText(f"Notebook: {display_name}")
         self.status_set_count_label.setText(f"Sets: {normalized_count} {set_word}")
 
+    def set_generation_running(self, running: bool):
+        self.question_button.set_generation_running(running)
+
+    def set_generation_progress(self, progress_text: str):
+        self.question_button.progress_label.setText(progress_text)
+
+    def set_model_status(self, status_text: str):
+        self.status_model_label.setText(status_text)
+
     def ask_notebook_name(self) -> str:
         notebook_name, ok = QInputDialog.getText(self, "Save Notebook", "Notebook name:")
         if not ok:
@@ -205,6 +255,28 @@ class QuestionSetting(QWidget):
 
     def _on_generate_clicked(self):
         payload = self.collect_payload()
+        if not payload["input_content"] and self.input_area.get_file_paths():
+            if self.input_area.start_file_extraction(self._requested_question_count(payload)):
+                self.pending_generate_payload = payload
+                self.question_button.generate_question_button.setEnabled(False)
+                return
+            payload["input_error"] = self.input_area.last_input_error
+
+        self._submit_generate_payload(payload)
+
+    def _on_input_extracted(self, documents):
+        payload = self.pending_generate_payload
+        self.pending_generate_payload = None
+        self.question_button.generate_question_button.setEnabled(True)
+        if payload is None:
+            return
+
+        payload["input_documents"] = [document["text"] for document in documents]
+        payload["input_content"] = "\n\n".join(payload["input_documents"])
+        payload["input_error"] = self.input_area.last_input_error
+        self._submit_generate_payload(payload)
+
+    def _submit_generate_payload(self, payload: Dict):
         validation_error = self._validate_payload(payload)
         if validation_error:
             QMessageBox.critical(self, "Error!", validation_error, buttons=QMessageBox.Ignore, defaultButton=QMessageBox.Ignore)
@@ -225,24 +297,31 @@ class QuestionSetting(QWidget):
         if not payload["language"]:
             return "No language selected.\nPlease select a language."
 
-        total_selected = (
+        if self._requested_question_count(payload) <= 0:
+            return "No question amount selected.\nPlease choose at least one question type and quantity."
+
+        return ""
+
+    def _requested_question_count(self, payload: Dict) -> int:
+        return (
             payload["multiple_choice_qty"]
             + payload["true_or_false_qty"]
             + payload["identification_qty"]
             + payload["essay_qty"]
         )
-        if total_selected <= 0:
-            return "No question amount selected.\nPlease choose at least one question type and quantity."
-
-        return ""
 
     def _language_chosen_english(self):
         if self.english.isChecked():
-            self.language_chosen = "English"
+            self._set_language_chosen("English")
 
     def _language_chosen_filipino(self):
         if self.filipino.isChecked():
-            self.language_chosen = "Filipino"
+            self._set_language_chosen("Filipino")
+
+    def _set_language_chosen(self, language):
+        self.language_chosen = language
+        if language:
+            self.language_changed.emit(language)
 
     def _initialize_spinboxes(self):
         self.multiple_choice_spinbox = SpinBox()
@@ -318,11 +397,30 @@ class QuestionButton(QWidget):
         self.generate_question_button.setStyleSheet("padding: 8px; font-size: 14px;")
         self.view_generated_button = QPushButton("View Generated Question/s")
         self.view_generated_button.setStyleSheet("padding: 8px; font-size: 14px;")
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setStyleSheet("padding: 8px; font-size: 14px;")
+        self.cancel_button.setVisible(False)
+        self.progress_label = QLabel()
+        self.progress_label.setStyleSheet("font-size: 12px; color: #777;")
+        self.progress_label.setVisible(False)
 
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.generate_question_button)
+        button_layout.addWidget(self.cancel_button)
         button_layout.addWidget(self.view_generated_button)
-        self.setLayout(button_layout)
+
+        layout = QVBoxLayout()
+        layout.addLayout(button_layout)
+        layout.addWidget(self.progress_label)
+        self.setLayout(layout)
+
+    def set_generation_running(self, running: bool):
+        self.generate_question_button.setEnabled(not running)
+        self.cancel_button.setVisible(running)
+        self.cancel_button.setEnabled(running)
+        self.progress_label.setVisible(running)
+        if not running:
+            self.progress_label.setText("")
 
 
 class SideBarNotebook(QWidget):
@@ -432,20 +530,30 @@ class SideBarNotebook(QWidget):
 
 
 class InputArea(QWidget):
+    extraction_completed = Signal(object)
+
+    supported_extensions = (".txt", ".pdf", ".doc", ".docx", ".ppt", ".pptx")
+
     def __init__(self):
         super().__init__()
 
         self.last_input_error = ""
+        max_input_chars = os.getenv("READINGQUIZ_MAX_INPUT_CHARS")
+        self.max_input_chars = max(0, int(max_input_chars)) if max_input_chars else None
+        self.min_input_chars = max(1, int(os.getenv("READINGQUIZ_MIN_INPUT_CHARS", "20000")))
+        self.input_chars_per_question = max(1, int(os.getenv("READINGQUIZ_INPUT_CHARS_PER_QUESTION", "2000")))
+        self.extraction_worker = None
+        self.file_statuses = []
         self._context_hidden = False
         self._context_cache = {}
 
         self.tab_widget = QTabWidget(self)
 
         widget_file = QWidget()
-        label_file = QLabel("Input (PDF, DOC, DOCX, or PPT) file :")
+        label_file = QLabel("Input (PDF, DOC, DOCX, PPT, or TXT) files :")
         label_file.setStyleSheet("font-size: 14px;")
 
-        self.input_file = QPushButton("Choose File")
+        self.input_file = QPushButton("Choose Files")
         self.input_file.setStyleSheet("padding:8px;font-size: 14px; text-align: center;")
         self.input_file.clicked.connect(self.getFileName)
 
@@ -454,7 +562,11 @@ class InputArea(QWidget):
         self.textbox.setStyleSheet("padding:8px;font-size: 14px;")
         self.textbox.setMinimumHeight(400)
 
-        self.remove_file = QPushButton("Remove File")
+        self.extraction_status = QLabel()
+        self.extraction_status.setStyleSheet("font-size: 12px; color: #777;")
+        self.extraction_status.setWordWrap(True)
+
+        self.remove_file = QPushButton("Remove Files")
         self.remove_file.setStyleSheet("padding:8px;font-size: 14px; text-align: center;")
         self.remove_file.clicked.connect(self.removeFileName)
 
@@ -462,6 +574,7 @@ class InputArea(QWidget):
         form_layout.addWidget(label_file)
         form_layout.addWidget(self.input_file)
         form_layout.addWidget(self.textbox)
+        form_layout.addWidget(self.extraction_status)
         form_layout.addWidget(self.remove_file)
         form_layout.setAlignment(Qt.AlignTop)
         widget_file.setLayout(form_layout)
@@ -487,57 +600,106 @@ class InputArea(QWidget):
         self.setLayout(layout)
 
     def getFileName(self):
-        file_filter = "Word File (*.docx *.doc);; PDF (*.pdf);; Presentation (*.pptx *.ppt);; Text File (*.txt)"
-        response = QFileDialog.getOpenFileName(
+        file_filter = (
+            "Supported Files (*.docx *.doc *.pdf *.pptx *.ppt *.txt);; Word File (*.docx *.doc);; PDF (*.pdf);; "
+            "Presentation (*.pptx *.ppt);; Text File (*.txt)"
+        )
+        response = QFileDialog.getOpenFileNames(
             parent=self,
-            caption="Select a file",
+            caption="Select files",
             dir=os.getcwd(),
             filter=file_filter,
-            selectedFilter="Word File (*.docx *.doc)",
+            selectedFilter="Supported Files (*.docx *.doc *.pdf *.pptx *.ppt *.txt)",
         )
-        self.textbox.setText(response[0])
-        self.input_file.setText("Update File")
+        if not response[0]:
+            return
+
+        self.textbox.setText("\n".join(response[0]))
+        self.extraction_status.setText("")
+        self.input_file.setText("Update Files")
         self.tab_widget.setTabEnabled(1, False)
 
     def removeFileName(self):
         self.tab_widget.setTabEnabled(1, True)
-        self.input_file.setText("Choose File")
+        self.input_file.setText("Choose Files")
         self.textbox.setText("")
+        self.extraction_status.setText("")
 
     def isEmpty(self):
         text = self.input_message.toPlainText()
         self.tab_widget.setTabEnabled(0, text == "")
 
-    def get_input_content(self) -> str:
-        self.last_input_error = ""
-        file_path = self.textbox.text().strip()
-        text_input = self.input_message.toPlainText().strip()
+    def get_file_paths(self) -> List[str]:
+        return [line.strip() for line in self.textbox.text().splitlines() if line.strip()]
 
-        if text_input:
-            return text_input
+    def input_char_budget(self, question_count: int):
+        if self.max_input_chars is not None:
+            return self.max_input_chars or None
+        return max(self.min_input_chars, question_count * self.input_chars_per_question)
 
-        if not file_path:
-            return ""
+    def start_file_extraction(self, question_count: int = 0) -> bool:
+        self.last_input_error = ""
+        file_paths = self.get_file_paths()
+        if not file_paths or self.extraction_worker is not None:
+            return False
+
+        unsupported = [path for path in file_paths if not path.lower().endswith(self.supported_extensions)]
+        if unsupported:
+            self.last_input_error = (
+                f"Unsupported file type: {os.path.basename(unsupported[0])}\n"
+                "Please use TXT, PDF, DOC/DOCX, or PPT/PPTX."
+            )
+            return False
+
+        self.file_statuses = ["Waiting..."] * len(file_paths)
+        self._show_file_statuses()
+
+        worker = DocumentExtractionWorker(file_paths, self.input_char_budget(question_count))
+        worker.file_progress.connect(self._handle_file_progress)
+        worker.completed.connect(self._handle_extraction_completed)
+        worker.finished.connect(self._handle_extraction_worker_finished)
+        self.extraction_worker = worker
+        worker.start()
+        return True
+
+    def _handle_file_progress(self, index, status):
+        if 0 <= index < len(self.file_statuses):
+            self.file_statuses[index] = status
+            self._show_file_statuses()
+
+    def _show_file_statuses(self):
+        file_paths = self.get_file_paths()
+        self.extraction_status.setText(
+            "\n".join(
+                f"{os.path.basename(path)}: {status}" for path, status in zip(file_paths, self.file_statuses)
+            )
+        )
 
-        supported_extensions = (".txt", ".pdf", ".doc", ".docx", ".ppt", ".pptx")
-        if file_path.lower().endswith(supported_extensions):
-            try:
-                return ExtractText(file_path).convert()
-            except OSError:
-                self.last_input_error = "Could not open the selected file. Please verify the path and permissions."
-                return ""
-            except RuntimeError as error:
-                self.last_input_error = f"{error}\nPython: {sys.executable}"
-                return ""
-            except Exception:
-                self.last_input_error = (
-                    "Failed to extract text from the selected file. "
-                    "For PDF/DOCX/PPTX support, install: pymupdf python-docx python-pptx"
-                )
-                return ""
-
-        self.last_input_error = "Unsupported file type. Please use TXT, PDF, DOC/DOCX, or PPT/PPTX."
-        return ""
+    def _handle_extraction_completed(self, results):
+        documents = [result for result in results if result["text"]]
+        errors = [result for result in results if result["error"] is not None]
+        for result in errors:
+            print(f"Extraction failed for {result['path']}: {result['error']}")
+
+        if errors and not documents:
+            self.last_input_error = self._describe_extraction_error(errors[0]["error"])
+        self.extraction_completed.emit(documents)
+
+    def _handle_extraction_worker_finished(self):
+        worker = self.extraction_worker
+        self.extraction_worker = None
+        if worker is not None:
+            worker.deleteLater()
+
+    def _describe_extraction_error(self, error) -> str:
+        if isinstance(error, OSError):
+            return "Could not open the selected file. Please verify the path and permissions."
+        if isinstance(error, RuntimeError):
+            return f"{error}\nPython: {sys.executable}"
+        return (
+            "Failed to extract text from the selected file. "
+            "For PDF/DOCX/PPTX support, install: pymupdf python-docx python-pptx"
+        )
 
     def load_saved_input(self, file_input: str, text_input: str):
         if text_input:
@@ -551,7 +713,8 @@ class InputArea(QWidget):
 
         if file_input:
             self.textbox.setText(file_input)
-            self.input_file.setText("Update File")
+            self.extraction_status.setText("")
+            self.input_file.setText("Update Files")
             self.tab_widget.setTabEnabled(1, False)
             self.tab_widget.setCurrentIndex(0)
         else:
@@ -567,6 +730,7 @@ class InputArea(QWidget):
         if hidden and not self._context_hidden:
             self._context_cache = {
                 "textbox_text": self.textbox.text(),
+                "extraction_status_text": self.extraction_status.text(),
                 "input_message_text": self.input_message.toPlainText(),
                 "input_file_text": self.input_file.text(),
                 "remove_file_text": self.remove_file.text(),
@@ -580,6 +744,7 @@ class InputArea(QWidget):
 
             masked_text = "Content hidden while quiz is in progress."
             self.textbox.setText(masked_text)
+            self.extraction_status.setText("")
             self.input_message.setPlainText(masked_text)
             self.input_message.setReadOnly(True)
 
@@ -592,9 +757,10 @@ class InputArea(QWidget):
 
         if not hidden and self._context_hidden:
             self.textbox.setText(self._context_cache.get("textbox_text", ""))
+            self.extraction_status.setText(self._context_cache.get("extraction_status_text", ""))
             self.input_message.setPlainText(self._context_cache.get("input_message_text", ""))
-            self.input_file.setText(self._context_cache.get("input_file_text", "Choose File"))
-            self.remove_file.setText(self._context_cache.get("remove_file_text", "Remove File"))
+            self.input_file.setText(self._context_cache.get("input_file_text", "Choose Files"))
+            self.remove_file.setText(self._context_cache.get("remove_file_text", "Remove Files"))
             self.input_file.setEnabled(bool(self._context_cache.get("input_file_enabled", True)))
             self.remove_file.setEnabled(bool(self._context_cache.get("remove_file_enabled", True)))
             self.input_message.setReadOnly(bool(self._context_cache.get("input_message_read_only", False)))
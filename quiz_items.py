@@ -0,0 +1,69 @@
+from typing import Dict, Iterable, List
+
+QUESTION_TYPES = ("multiple_choice", "true_or_false", "identification", "essay")
+
+
+class QuestionItem:
+    __slots__ = ("question_type", "question", "choices", "answer", "context")
+
+    def __init__(self, question_type: str, question: str, choices=(), answer: str = "", context: str = ""):
+        self.question_type = question_type if question_type in QUESTION_TYPES else "essay"
+        self.question = question or ""
+        self.choices = tuple(choices or ())
+        self.answer = answer or ""
+        self.context = context or ""
+
+    def replace(self, **changes) -> "QuestionItem":
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return QuestionItem(**values)
+
+    def to_dict(self) -> Dict:
+        return {
+            "question_type": self.question_type,
+            "question": self.question,
+            "choices": list(self.choices),
+            "answer": self.answer,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "QuestionItem":
+        return cls(
+            data.get("question_type", "essay"),
+            data.get("question", ""),
+            data.get("choices", ()),
+            data.get("answer", ""),
+            data.get("context", ""),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, QuestionItem):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"QuestionItem({self.question_type!r}, {self.question!r}, answer={self.answer!r})"
+
+
+def render_question_items(items: Iterable[QuestionItem], language: str = "English") -> str:
+    manual_check_note = "Note: Manual checking required."
+    if str(language or "").strip().lower() == "filipino":
+        manual_check_note = "Note: Kailangan ng manwal na pag-check."
+
+    output_lines: List[str] = []
+    for number, item in enumerate(items, start=1):
+        output_lines.append(f"{number}. {item.question}")
+        if item.question_type == "essay":
+            output_lines.append(manual_check_note)
+            output_lines.append("")
+            continue
+
+        output_lines.extend(item.choices)
+        if item.answer:
+            output_lines.append(f"Answer: {item.answer}")
+        if item.context:
+            output_lines.append(f"Context: {item.context}")
+        output_lines.append("")
+
+    return "\n".join(output_lines).strip()
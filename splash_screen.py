@@ -0,0 +1,95 @@
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+class SplashScreen(QWidget):
+    finished = Signal()
+
+    def __init__(self, minimum_display_ms=1500):
+        super().__init__()
+        self.progress = 0
+        self.stage_text = "loading..."
+        self._is_finished = False
+        self.setFixedSize(420, 320)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+        QTimer.singleShot(minimum_display_ms, self._finish)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        screen = self.screen() or QApplication.primaryScreen()
+        if screen:
+            geometry = screen.availableGeometry()
+            self.move(
+                geometry.center().x() - (self.width() // 2),
+                geometry.center().y() - (self.height() // 2),
+            )
+
+    def set_progress(self, value, stage_text):
+        self.progress = max(self.progress, min(100, int(value)))
+        self.stage_text = stage_text
+        self.update()
+        if self.progress >= 100:
+            QTimer.singleShot(120, self._finish)
+
+    def _finish(self):
+        if self._is_finished:
+            return
+        self._is_finished = True
+        self.finished.emit()
+        self.close()
+
+    def paintEvent(self, event):
+        _ = event
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        circle_size = 220
+        x = (self.width() - circle_size) // 2
+        y = (self.height() - circle_size) // 2
+
+        shadow_offset = 6
+        shadow_size = circle_size + 8
+        shadow_x = x - 4 + shadow_offset
+        shadow_y = y - 4 + shadow_offset
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 90))
+        painter.drawEllipse(shadow_x, shadow_y, shadow_size, shadow_size)
+
+        painter.setPen(Qt.NoPen)
+        inner_gap = 18
+        fill_x = x + inner_gap
+        fill_y = y + inner_gap
+        fill_size = circle_size - (inner_gap * 2)
+        fill_gradient = QLinearGradient(fill_x, fill_y, fill_x + fill_size, fill_y + fill_size)
+        fill_gradient.setColorAt(0.0, QColor("#EDF0D8"))
+        fill_gradient.setColorAt(1.0, QColor("#CFE3FF"))
+        painter.setBrush(fill_gradient)
+        painter.drawEllipse(fill_x, fill_y, fill_size, fill_size)
+
+        base_pen = QPen(QColor("#2c3146"), 12)
+        base_pen.setCapStyle(Qt.RoundCap)
+        painter.setPen(base_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawEllipse(x, y, circle_size, circle_size)
+
+        progress_pen = QPen(QColor("#ff5cb8"), 12)
+        progress_pen.setCapStyle(Qt.RoundCap)
+        painter.setPen(progress_pen)
+        start_angle = 90 * 16
+        span_angle = int(-360 * 16 * (self.progress / 100.0))
+        painter.drawArc(x, y, circle_size, circle_size, start_angle, span_angle)
+
+        painter.setPen(QColor("#111111"))
+        painter.setFont(QFont("Segoe UI", 9))
+        painter.drawText(x, y + 72, circle_size, 20, Qt.AlignCenter, "ReadingQuizAI")
+
+        painter.setPen(QColor("#ff7ac4"))
+        painter.setFont(QFont("Segoe UI", 32, QFont.Bold))
+        painter.drawText(x, y + 92, circle_size, 52, Qt.AlignCenter, f"{self.progress}%")
+
+        painter.setPen(QColor("#b7bbca"))
+        painter.setFont(QFont("Segoe UI", 10))
+        painter.drawText(x, y + 170, circle_size, 20, Qt.AlignCenter, self.stage_text)
@@ -0,0 +1,92 @@
+import codecs
+import mmap
+import os
+import re
+from typing import Iterator
+
+TEXT_BLOCK_BYTES = max(4096, int(os.getenv("READINGQUIZ_TEXT_BLOCK_BYTES", str(256 * 1024))))
+SNIFF_BYTES = 64 * 1024
+
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"[.!?][\"')\]]*\s")
+
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _decode_as_latin1(error):
+    return error.object[error.start:error.end].decode("latin-1"), error.end
+
+
+codecs.register_error("readingquiz-latin1", _decode_as_latin1)
+
+
+def sniff_encoding(prefix: bytes) -> str:
+    for byte_order_mark, encoding in BYTE_ORDER_MARKS:
+        if prefix.startswith(byte_order_mark):
+            return encoding
+
+    sample = prefix[:4096]
+    if sample and sample.count(b"\x00") * 4 > len(sample):
+        even_nulls = sample[0::2].count(b"\x00")
+        odd_nulls = sample[1::2].count(b"\x00")
+        return "utf-16-le" if odd_nulls > even_nulls else "utf-16-be"
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
+
+def iter_text_chunks(path) -> Iterator[str]:
+    with open(path, "rb") as handle:
+        file_size = os.fstat(handle.fileno()).st_size
+        if file_size == 0:
+            return
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            encoding = sniff_encoding(mapped[:SNIFF_BYTES])
+            decoder = codecs.getincrementaldecoder(encoding)(errors="readingquiz-latin1")
+            pending = ""
+            for start in range(0, file_size, TEXT_BLOCK_BYTES):
+                pending += decoder.decode(mapped[start:start + TEXT_BLOCK_BYTES])
+                carry = ""
+                if pending.endswith("\r"):
+                    pending, carry = pending[:-1], "\r"
+                pending = _normalize_newlines(pending)
+                if start + TEXT_BLOCK_BYTES >= file_size:
+                    pending += carry
+                    break
+
+                cut = _last_sentence_boundary(pending)
+                if cut is None and len(pending) > TEXT_BLOCK_BYTES * 4:
+                    cut = pending.rfind(" ")
+                    cut = cut if cut > 0 else len(pending)
+                if cut is not None:
+                    yield pending[:cut]
+                    pending = pending[cut + 1:]
+                pending += carry
+
+            pending = _normalize_newlines(pending + decoder.decode(b"", final=True))
+            if pending:
+                yield pending
+
+
+def _normalize_newlines(text: str) -> str:
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _last_sentence_boundary(text: str):
+    last_match = None
+    for last_match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        pass
+    if last_match is None:
+        return None
+    return last_match.end() - 1
@@ -0,0 +1,127 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PySide6.QtCore import QThread, Signal
+
+from extract_text import ExtractText
+from question_generator import GenerationCancelled, QuestionGenerator
+
+
+class ModelLoaderWorker(QThread):
+    progress_changed = Signal(int, str)
+    loaded = Signal(object)
+    failed = Signal(str)
+
+    def run(self):
+        try:
+            generator = QuestionGenerator(progress_callback=self.progress_changed.emit)
+            generator.warm_up()
+            self.loaded.emit(generator)
+        except Exception as error:
+            self.failed.emit(str(error))
+
+
+class TranslationPrefetchWorker(QThread):
+    loaded = Signal()
+    failed = Signal(str)
+
+    def __init__(self, generator):
+        super().__init__()
+        self.generator = generator
+
+    def run(self):
+        try:
+            self.generator.prefetch_translation_models()
+            self.loaded.emit()
+        except Exception as error:
+            self.failed.emit(str(error))
+
+
+class DocumentExtractionWorker(QThread):
+    file_progress = Signal(int, str)
+    completed = Signal(object)
+
+    def __init__(self, file_paths, max_chars=None):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.max_chars = max_chars
+
+    def run(self):
+        results = [None] * len(self.file_paths)
+        max_workers = max(1, min(len(self.file_paths), int(os.getenv("READINGQUIZ_EXTRACTION_WORKERS", "4"))))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._extract_file, index, file_path): index
+                for index, file_path in enumerate(self.file_paths)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    text = future.result()
+                except Exception as error:
+                    results[index] = {"path": self.file_paths[index], "text": "", "error": error}
+                    self.file_progress.emit(index, "Failed")
+                    continue
+
+                results[index] = {"path": self.file_paths[index], "text": text, "error": None}
+                self.file_progress.emit(index, f"Done ({len(text):,} characters)" if text else "No readable text")
+
+        self.completed.emit(results)
+
+    def _extract_file(self, index, file_path):
+        self.file_progress.emit(index, "Extracting...")
+        return ExtractText(file_path).convert(max_chars=self.max_chars)
+
+
+class GenerationWorker(QThread):
+    progress_changed = Signal(str, int, int)
+    question_ready = Signal(object)
+    completed = Signal(str)
+    cancelled = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, generator, input_text, question_types, quantities, language, decoding_profile=None):
+        super().__init__()
+        self.generator = generator
+        self.input_text = input_text
+        self.question_types = question_types
+        self.quantities = quantities
+        self.language = language
+        self.decoding_profile = decoding_profile
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        items = []
+        try:
+            for item in self.generator.iter_questions(
+                self.input_text,
+                self.question_types,
+                self.quantities,
+                self.language,
+                use_story_compression=True,
+                decoding_profile=self.decoding_profile,
+                progress_callback=self.progress_changed.emit,
+                cancel_event=self._cancel_event,
+            ):
+                items.append(item)
+                self.question_ready.emit(item)
+        except GenerationCancelled:
+            self.cancelled.emit(self.generator.render_question_items(items, self.language))
+            return
+        except Exception as error:
+            self.failed.emit(str(error))
+            return
+
+        if not items:
+            self.completed.emit("Error: Could not generate questions from the text.")
+            return
+
+        self.progress_changed.emit("format", 1, 1)
+        self.completed.emit(self.generator.render_question_items(items, self.language))